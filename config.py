@@ -27,5 +27,8 @@ MIN_ENTRIES_FOR_SUGGESTIONS = 5
 # Notification settings
 NOTIFICATIONS_ENABLED = True
 
-# Create data directory if it doesn't exist
-os.makedirs(os.path.dirname(DB_PATH), exist_ok=True)
+def ensure_dirs():
+    # Create data directories if they don't exist
+    os.makedirs(os.path.dirname(DB_PATH), exist_ok=True)
+    os.makedirs(os.path.dirname(ENCRYPTION_KEY_FILE), exist_ok=True)
+
@@ -1,15 +1,53 @@
 import sqlite3
 import os
+import threading
 from datetime import datetime
 import config
+from database.pool import ConnectionPool
+
+_pool = None
+_pool_lock = threading.Lock()
+
+# Write-through cache of app_settings; a cached None marks a key known to be absent
+_setting_cache = {}
+_cache_lock = threading.Lock()
+
+def get_pool():
+    global _pool
+
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                # First database access (initialize_database at startup) creates the data dir
+                config.ensure_dirs()
+                _pool = ConnectionPool(config.DB_PATH)
+
+    return _pool
 
 def get_connection():
-    return sqlite3.connect(config.DB_PATH)
+    return get_pool().connection()
+
+def get_transaction():
+    return get_pool().transaction()
 
 def initialize_database():
-    conn = get_connection()
+    with get_connection() as conn:
+        # page_size only takes effect on a fresh database and must precede the switch to WAL;
+        # neither can be changed inside a transaction
+        conn.execute('PRAGMA page_size=8192')
+        conn.execute('PRAGMA journal_mode=WAL')
+
+    # DDL doesn't open sqlite3's implicit transaction, so without an explicit one
+    # every CREATE below would commit on its own
+    with get_transaction() as conn:
+        _create_schema(conn)
+
+    set_default_settings()
+    preload_settings()
+
+def _create_schema(conn):
     cursor = conn.cursor()
-    
+
     cursor.execute('''
         CREATE TABLE IF NOT EXISTS todos (
             id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -66,11 +104,69 @@ def initialize_database():
             updated_at TEXT DEFAULT CURRENT_TIMESTAMP
         )
     ''')
-    
-    conn.commit()
-    conn.close()
 
-    set_default_settings()
+    # Indices matching the WHERE/ORDER BY clauses used in database/models.py
+    cursor.execute('CREATE INDEX IF NOT EXISTS idx_journal_created_at ON journal_entries(created_at)')
+    cursor.execute('CREATE INDEX IF NOT EXISTS idx_calendar_event_date ON calendar_events(event_date, created_at)')
+    cursor.execute('CREATE INDEX IF NOT EXISTS idx_todos_created_at ON todos(created_at)')
+    cursor.execute('CREATE INDEX IF NOT EXISTS idx_pomodoro_started_at ON pomodoro_sessions(started_at)')
+
+    _create_journal_fts(cursor)
+
+def _create_journal_fts(cursor):
+    # Full-text index over journal title/content; skipped if SQLite lacks FTS5,
+    # in which case JournalEntry.search_entries falls back to LIKE.
+    # Encrypted entries contribute only their title, so ciphertext is never tokenized.
+    try:
+        cursor.execute('''
+            CREATE VIRTUAL TABLE IF NOT EXISTS journal_fts USING fts5(
+                title, content,
+                content='journal_entries', content_rowid='id', tokenize='unicode61'
+            )
+        ''')
+    except sqlite3.OperationalError as e:
+        print(f"Full-text search unavailable: {e}")
+        return
+
+    # Triggers from before encrypted content was excluded (or none at all) mean
+    # the index has to be rebuilt; after that this is a single lookup per startup
+    cursor.execute("SELECT sql FROM sqlite_master WHERE type = 'trigger' AND name = 'journal_fts_ai'")
+    row = cursor.fetchone()
+    if row is not None and 'is_encrypted' in row[0]:
+        return
+
+    for trigger in ('journal_fts_ai', 'journal_fts_ad', 'journal_fts_au'):
+        cursor.execute(f'DROP TRIGGER IF EXISTS {trigger}')
+
+    cursor.execute('''
+        CREATE TRIGGER journal_fts_ai AFTER INSERT ON journal_entries BEGIN
+            INSERT INTO journal_fts(rowid, title, content)
+            VALUES (new.id, new.title, CASE WHEN new.is_encrypted THEN '' ELSE new.content END);
+        END
+    ''')
+
+    cursor.execute('''
+        CREATE TRIGGER journal_fts_ad AFTER DELETE ON journal_entries BEGIN
+            INSERT INTO journal_fts(journal_fts, rowid, title, content)
+            VALUES ('delete', old.id, old.title, CASE WHEN old.is_encrypted THEN '' ELSE old.content END);
+        END
+    ''')
+
+    cursor.execute('''
+        CREATE TRIGGER journal_fts_au AFTER UPDATE ON journal_entries BEGIN
+            INSERT INTO journal_fts(journal_fts, rowid, title, content)
+            VALUES ('delete', old.id, old.title, CASE WHEN old.is_encrypted THEN '' ELSE old.content END);
+            INSERT INTO journal_fts(rowid, title, content)
+            VALUES (new.id, new.title, CASE WHEN new.is_encrypted THEN '' ELSE new.content END);
+        END
+    ''')
+
+    # 'rebuild' would re-read content straight from journal_entries, ciphertext included
+    cursor.execute("INSERT INTO journal_fts(journal_fts) VALUES ('delete-all')")
+    cursor.execute('''
+        INSERT INTO journal_fts(rowid, title, content)
+        SELECT id, title, CASE WHEN is_encrypted THEN '' ELSE content END FROM journal_entries
+    ''')
 
 def set_default_settings():
 
@@ -90,39 +186,58 @@ def set_default_settings():
         'journal_lockout_time': '0'
     }
     
-    conn = get_connection()
-    cursor = conn.cursor()
-    
-    for key, value in settings.items():
-        cursor.execute('''
+    with get_connection() as conn:
+        conn.executemany('''
             INSERT OR IGNORE INTO app_settings (key, value)
             VALUES (?, ?)
-        ''', (key, value))
-    
-    conn.commit()
-    conn.close()
+        ''', list(settings.items()))
+
+def preload_settings():
+
+    with get_connection() as conn:
+        rows = conn.execute('SELECT key, value FROM app_settings').fetchall()
+
+    with _cache_lock:
+        _setting_cache.clear()
+        _setting_cache.update((row['key'], row['value']) for row in rows)
 
 def get_setting(key, default=None):
 
-    conn = get_connection()
-    cursor = conn.cursor()
-    
-    cursor.execute('SELECT value FROM app_settings WHERE key = ?', (key,))
-    result = cursor.fetchone()
-    
-    conn.close()
+    with _cache_lock:
+        if key in _setting_cache:
+            value = _setting_cache[key]
+            return default if value is None else value
+
+    with get_connection() as conn:
+        cursor = conn.cursor()
+        
+        cursor.execute('SELECT value FROM app_settings WHERE key = ?', (key,))
+        result = cursor.fetchone()
+
+    value = result[0] if result else None
+
+    with _cache_lock:
+        _setting_cache[key] = value
     
-    return result[0] if result else default
+    return default if value is None else value
 
 def set_setting(key, value):
 
-    conn = get_connection()
-    cursor = conn.cursor()
-    
-    cursor.execute('''
-        INSERT OR REPLACE INTO app_settings (key, value, updated_at)
-        VALUES (?, ?, ?)
-    ''', (key, value, datetime.now().isoformat()))
-    
-    conn.commit()
-    conn.close()
\ No newline at end of file
+    with get_connection() as conn:
+        cursor = conn.cursor()
+        
+        cursor.execute('''
+            INSERT OR REPLACE INTO app_settings (key, value, updated_at)
+            VALUES (?, ?, ?)
+        ''', (key, value, datetime.now().isoformat()))
+
+    with _cache_lock:
+        _setting_cache[key] = value
+
+def invalidate_setting(key=None):
+
+    with _cache_lock:
+        if key is None:
+            _setting_cache.clear()
+        else:
+            _setting_cache.pop(key, None)
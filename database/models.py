@@ -1,70 +1,88 @@
-from datetime import datetime
-from database.db import get_connection
+import sqlite3
+from datetime import date, datetime, timedelta
+from database.db import get_connection, get_transaction
+
+TODO_COLUMNS = 'id, title, description, completed, priority, due_date, created_at, updated_at'
+# encrypted_content is deliberately left out; see JournalEntry.get_encrypted_blob
+JOURNAL_COLUMNS = 'id, title, content, is_encrypted, mood_rating, created_at, updated_at'
+POMODORO_COLUMNS = 'id, duration, task_description, completed, started_at, ended_at'
+CALENDAR_COLUMNS = 'id, title, description, event_date, priority, created_at, updated_at'
+
+# UPDATE ... RETURNING needs SQLite 3.35+
+HAS_RETURNING = sqlite3.sqlite_version_info >= (3, 35, 0)
+
+
+def _release_cursor(conn, cursor):
+    # Used by the iter_all() generators, which may be abandoned mid-iteration:
+    # resetting the statement drops its read snapshot before the connection is pooled
+    cursor.close()
+    if conn.in_transaction:
+        conn.rollback()
+
 
 class Todo:
    
     @staticmethod
     def create(title, description="", priority=1, due_date=None):
-        conn = get_connection()
-        cursor = conn.cursor()
+        with get_connection() as conn:
+            cursor = conn.cursor()
         
-        cursor.execute('''
-            INSERT INTO todos (title, description, priority, due_date)
-            VALUES (?, ?, ?, ?)
-        ''', (title, description, priority, due_date))
+            cursor.execute('''
+                INSERT INTO todos (title, description, priority, due_date)
+                VALUES (?, ?, ?, ?)
+            ''', (title, description, priority, due_date))
         
-        todo_id = cursor.lastrowid
-        conn.commit()
-        conn.close()
+            todo_id = cursor.lastrowid
         
         return todo_id
     
+    @staticmethod
+    def create_many(todos):
+        # Prefer over looping create(): one transaction for the whole batch.
+        # Each item is (title, description, priority, due_date).
+        with get_transaction() as conn:
+            conn.executemany('''
+                INSERT INTO todos (title, description, priority, due_date)
+                VALUES (?, ?, ?, ?)
+            ''', todos)
+    
     @staticmethod
     def get_all():
-        conn = get_connection()
-        cursor = conn.cursor()
+        with get_connection() as conn:
+            cursor = conn.cursor()
         
-        cursor.execute('SELECT * FROM todos ORDER BY created_at DESC')
-        todos = cursor.fetchall()
+            cursor.execute(f'SELECT {TODO_COLUMNS} FROM todos ORDER BY created_at DESC')
+            todos = cursor.fetchall()
         
-        conn.close()
         return todos
     
     @staticmethod
     def update_completed(todo_id, completed):
-        conn = get_connection()
-        cursor = conn.cursor()
-        
-        cursor.execute('''
-            UPDATE todos SET completed = ?, updated_at = ?
-            WHERE id = ?
-        ''', (completed, datetime.now().isoformat(), todo_id))
-        
-        conn.commit()
-        conn.close()
+        with get_connection() as conn:
+            conn.execute('''
+                UPDATE todos SET completed = ?, updated_at = ?
+                WHERE id = ?
+            ''', (completed, datetime.now().isoformat(), todo_id))
     
     @staticmethod
     def update_title(todo_id, title):
-        conn = get_connection()
-        cursor = conn.cursor()
-        
-        cursor.execute('''
-            UPDATE todos SET title = ?, updated_at = ?
-            WHERE id = ?
-        ''', (title, datetime.now().isoformat(), todo_id))
-        
-        conn.commit()
-        conn.close()
+        with get_connection() as conn:
+            conn.execute('''
+                UPDATE todos SET title = ?, updated_at = ?
+                WHERE id = ?
+            ''', (title, datetime.now().isoformat(), todo_id))
     
     @staticmethod
     def delete(todo_id):
-        conn = get_connection()
-        cursor = conn.cursor()
-        
-        cursor.execute('DELETE FROM todos WHERE id = ?', (todo_id,))
+        with get_connection() as conn:
+            cursor = conn.cursor()
         
-        conn.commit()
-        conn.close()
+            cursor.execute('DELETE FROM todos WHERE id = ?', (todo_id,))
+    
+    @staticmethod
+    def delete_many(todo_ids):
+        with get_transaction() as conn:
+            conn.executemany('DELETE FROM todos WHERE id = ?', ((todo_id,) for todo_id in todo_ids))
 
 class JournalEntry:
 
@@ -76,196 +94,267 @@ class JournalEntry:
         self.encrypted_content = encrypted_content
         self.is_encrypted = is_encrypted
         self.mood_rating = mood_rating
-        self.created_at = created_at or datetime.now()
-        self.updated_at = updated_at or datetime.now()
+        if not (created_at and updated_at):
+            now = datetime.now()
+            created_at = created_at or now
+            updated_at = updated_at or now
+        self.created_at = created_at
+        self.updated_at = updated_at
+    
+    @classmethod
+    def _row_to_entry(cls, row, _from_iso=datetime.fromisoformat):
+        # Shared by every JournalEntry query; _from_iso is bound as a default so
+        # the per-row lookup is a local rather than a global + attribute load.
+        mood_rating = row['mood_rating']
+        created_at = row['created_at']
+        updated_at = row['updated_at']
+        
+        return cls(
+            id=row['id'],
+            title=row['title'],
+            content=row['content'],
+            is_encrypted=bool(row['is_encrypted']),
+            mood_rating=mood_rating if mood_rating is not None else 3,
+            created_at=_from_iso(created_at) if created_at else None,
+            updated_at=_from_iso(updated_at) if updated_at else None
+        )
     
     @staticmethod
     def create(title, content, mood_rating=None, is_encrypted=False):
 
-        conn = get_connection()
-        cursor = conn.cursor()
+        with get_connection() as conn:
+            cursor = conn.cursor()
         
-        cursor.execute('''
-            INSERT INTO journal_entries (title, content, mood_rating, is_encrypted)
-            VALUES (?, ?, ?, ?)
-        ''', (title, content, mood_rating, is_encrypted))
+            cursor.execute('''
+                INSERT INTO journal_entries (title, content, mood_rating, is_encrypted)
+                VALUES (?, ?, ?, ?)
+            ''', (title, content, mood_rating, is_encrypted))
         
-        entry_id = cursor.lastrowid
-        conn.commit()
-        conn.close()
+            entry_id = cursor.lastrowid
         
         return entry_id
     
     @staticmethod
     def create_with_date(title, content, entry_date, mood_rating=None, is_encrypted=False):
 
-        conn = get_connection()
-        cursor = conn.cursor()
+        with get_connection() as conn:
+            cursor = conn.cursor()
         
-        # Convert date to datetime for storage
-        if isinstance(entry_date, datetime):
-            created_at = entry_date.isoformat()
-        else:
-            created_at = datetime.combine(entry_date, datetime.min.time()).isoformat()
+            # Convert date to datetime for storage
+            if isinstance(entry_date, datetime):
+                created_at = entry_date.isoformat()
+            else:
+                created_at = datetime.combine(entry_date, datetime.min.time()).isoformat()
         
-        cursor.execute('''
-            INSERT INTO journal_entries (title, content, mood_rating, is_encrypted, created_at, updated_at)
-            VALUES (?, ?, ?, ?, ?, ?)
-        ''', (title, content, mood_rating, is_encrypted, created_at, datetime.now().isoformat()))
+            cursor.execute('''
+                INSERT INTO journal_entries (title, content, mood_rating, is_encrypted, created_at, updated_at)
+                VALUES (?, ?, ?, ?, ?, ?)
+            ''', (title, content, mood_rating, is_encrypted, created_at, datetime.now().isoformat()))
         
-        entry_id = cursor.lastrowid
-        conn.commit()
-        conn.close()
+            entry_id = cursor.lastrowid
         
         return entry_id
     
     @staticmethod
-    def get_all():
+    def create_many(entries):
+        # Each item is (title, content, mood_rating, is_encrypted); see Todo.create_many
+        with get_transaction() as conn:
+            conn.executemany('''
+                INSERT INTO journal_entries (title, content, mood_rating, is_encrypted)
+                VALUES (?, ?, ?, ?)
+            ''', entries)
+    
+    @staticmethod
+    def get_all(limit=None):
 
-        conn = get_connection()
-        cursor = conn.cursor()
-        
-        cursor.execute('SELECT * FROM journal_entries ORDER BY created_at DESC')
-        rows = cursor.fetchall()
-        
-        conn.close()
-        
-        entries = []
-        for row in rows:
-            entry = JournalEntry(
-                id=row[0],
-                title=row[1],
-                content=row[2],
-                encrypted_content=row[3] if len(row) > 3 else None,
-                is_encrypted=bool(row[4]) if len(row) > 4 else False,
-                mood_rating=row[5] if len(row) > 5 and row[5] is not None else 3,
-                created_at=datetime.fromisoformat(row[6]) if len(row) > 6 and row[6] else datetime.now(),
-                updated_at=datetime.fromisoformat(row[7]) if len(row) > 7 and row[7] else datetime.now()
-            )
-            entries.append(entry)
+        # limit=None keeps returning every entry; -1 means "no limit" to SQLite
+        return JournalEntry.get_page(0, -1 if limit is None else limit)
+    
+    @staticmethod
+    def get_page(offset=0, limit=100):
+
+        with get_connection() as conn:
+            cursor = conn.cursor()
         
-        return entries
+            cursor.execute(f'''
+                SELECT {JOURNAL_COLUMNS} FROM journal_entries
+                ORDER BY created_at DESC
+                LIMIT ? OFFSET ?
+            ''', (limit, offset))
+            rows = cursor.fetchall()
+        
+        row_to_entry = JournalEntry._row_to_entry
+        return [row_to_entry(row) for row in rows]
+    
+    @staticmethod
+    def iter_all():
+
+        # Rows are pulled from the cursor one at a time, so the pooled connection is held
+        # until the generator is exhausted or closed. Callers that stop early must call
+        # close() on it (or wrap it in contextlib.closing) to return the connection.
+        with get_connection() as conn:
+            cursor = conn.execute(f'SELECT {JOURNAL_COLUMNS} FROM journal_entries ORDER BY created_at DESC')
+            try:
+                for row in cursor:
+                    yield JournalEntry._row_to_entry(row)
+            finally:
+                _release_cursor(conn, cursor)
     
     @staticmethod
     def get_by_date(entry_date):
 
-        conn = get_connection()
-        cursor = conn.cursor()
-        
         if isinstance(entry_date, datetime):
-            start_date = entry_date.replace(hour=0, minute=0, second=0, microsecond=0)
-            end_date = entry_date.replace(hour=23, minute=59, second=59, microsecond=999999)
-        else:
-            start_date = datetime.combine(entry_date, datetime.min.time())
-            end_date = datetime.combine(entry_date, datetime.max.time())
-        
-        cursor.execute('''
-            SELECT * FROM journal_entries 
-            WHERE created_at >= ? AND created_at <= ?
-            ORDER BY created_at DESC
-            LIMIT 1
-        ''', (start_date.isoformat(), end_date.isoformat()))
-        
-        row = cursor.fetchone()
-        conn.close()
+            entry_date = entry_date.date()
         
-        if row:
-            return JournalEntry(
-                id=row[0],
-                title=row[1],
-                content=row[2],
-                encrypted_content=row[3] if len(row) > 3 else None,
-                is_encrypted=bool(row[4]) if len(row) > 4 else False,
-                mood_rating=row[5] if len(row) > 5 and row[5] is not None else 3,
-                created_at=datetime.fromisoformat(row[6]) if len(row) > 6 and row[6] else datetime.now(),
-                updated_at=datetime.fromisoformat(row[7]) if len(row) > 7 and row[7] else datetime.now()
-            )
+        # Date-only bounds match both isoformat() ('T') and CURRENT_TIMESTAMP (' ') values
+        start_date = entry_date.isoformat()
+        end_date = (entry_date + timedelta(days=1)).isoformat()
+        
+        with get_connection() as conn:
+            cursor = conn.cursor()
+        
+            cursor.execute(f'''
+                SELECT {JOURNAL_COLUMNS} FROM journal_entries 
+                WHERE created_at >= ? AND created_at < ?
+                ORDER BY created_at DESC
+                LIMIT 1
+            ''', (start_date, end_date))
+        
+            row = cursor.fetchone()
         
-        return None
+        return JournalEntry._row_to_entry(row) if row else None
     
     @staticmethod
     def search_entries(query):
 
-        conn = get_connection()
-        cursor = conn.cursor()
-        
-        # Search by content (case-insensitive)
-        cursor.execute('''
-            SELECT * FROM journal_entries 
-            WHERE LOWER(content) LIKE ? OR LOWER(title) LIKE ?
-            ORDER BY created_at DESC
-        ''', (f'%{query.lower()}%', f'%{query.lower()}%'))
-        
-        rows = cursor.fetchall()
-        conn.close()
-        
-        entries = []
-        for row in rows:
-            entry = JournalEntry(
-                id=row[0],
-                title=row[1],
-                content=row[2],
-                encrypted_content=row[3] if len(row) > 3 else None,
-                is_encrypted=bool(row[4]) if len(row) > 4 else False,
-                mood_rating=row[5] if len(row) > 5 and row[5] is not None else 3,
-                created_at=datetime.fromisoformat(row[6]) if len(row) > 6 and row[6] else datetime.now(),
-                updated_at=datetime.fromisoformat(row[7]) if len(row) > 7 and row[7] else datetime.now()
+        # Every whitespace-separated term must match (AND), in the title or content.
+        # Encrypted entries are only searchable by title; see _create_journal_fts.
+        terms = query.split()
+        if not terms:
+            return JournalEntry.get_all()
+        
+        # Each term is quoted so user input can't inject FTS syntax; '*' makes it a word prefix
+        match = ' '.join('"{}"*'.format(term.replace('"', '""')) for term in terms)
+        
+        try:
+            with get_connection() as conn:
+                cursor = conn.cursor()
+            
+                cursor.execute(f'''
+                    SELECT {JOURNAL_COLUMNS} FROM journal_entries
+                    WHERE id IN (SELECT rowid FROM journal_fts WHERE journal_fts MATCH ?)
+                    ORDER BY created_at DESC
+                ''', (match,))
+            
+                rows = cursor.fetchall()
+        except sqlite3.OperationalError:
+            # FTS5 not available, fall back to a scan with the same per-term AND; each term
+            # matches as a substring rather than a word prefix. SQLite's LIKE is already
+            # case-insensitive for ASCII, so no per-row LOWER() copy is needed.
+            where = ' AND '.join(
+                "(title LIKE ? OR (NOT is_encrypted AND content LIKE ?))" for _ in terms
             )
-            entries.append(entry)
+            params = []
+            for term in terms:
+                pattern = f'%{term}%'
+                params += (pattern, pattern)
+            
+            with get_connection() as conn:
+                cursor = conn.cursor()
+            
+                cursor.execute(f'''
+                    SELECT {JOURNAL_COLUMNS} FROM journal_entries 
+                    WHERE {where}
+                    ORDER BY created_at DESC
+                ''', params)
+            
+                rows = cursor.fetchall()
         
-        return entries
+        row_to_entry = JournalEntry._row_to_entry
+        return [row_to_entry(row) for row in rows]
+    
+    @staticmethod
+    def get_encrypted_blob(entry_id):
+
+        with get_connection() as conn:
+            cursor = conn.cursor()
+        
+            cursor.execute('SELECT encrypted_content FROM journal_entries WHERE id = ?', (entry_id,))
+            row = cursor.fetchone()
+        
+        return row[0] if row else None
+    
+    @staticmethod
+    def get_encrypted_blobs(entry_ids):
+
+        # Batched get_encrypted_blob returning {id: blob}; ids are chunked to stay
+        # under SQLite's bound-parameter limit
+        entry_ids = list(entry_ids)
+        blobs = {}
+        
+        with get_connection() as conn:
+            for start in range(0, len(entry_ids), 500):
+                chunk = entry_ids[start:start + 500]
+                placeholders = ', '.join('?' * len(chunk))
+                rows = conn.execute(
+                    f'SELECT id, encrypted_content FROM journal_entries WHERE id IN ({placeholders})', chunk
+                )
+                blobs.update((row['id'], row['encrypted_content']) for row in rows)
+        
+        return blobs
     
     def update(self, title=None, content=None, mood_rating=None):
 
         if not self.id:
             return
         
-        conn = get_connection()
-        cursor = conn.cursor()
+        if title is None and content is None and mood_rating is None:
+            return
+        
+        now = datetime.now()
         
-        # Build update query dynamically
-        updates = []
-        params = []
+        # Fixed statement (COALESCE keeps unchanged columns) so sqlite3 reuses the prepared plan
+        query = '''
+            UPDATE journal_entries
+            SET title = COALESCE(?, title), content = COALESCE(?, content),
+                mood_rating = COALESCE(?, mood_rating), updated_at = ?
+            WHERE id = ?
+        '''
+        params = (title, content, mood_rating, now.isoformat(), self.id)
+        
+        with get_connection() as conn:
+            if HAS_RETURNING:
+                # Refresh from the stored row instead of issuing a follow-up SELECT
+                row = conn.execute(query + 'RETURNING title, content, mood_rating, updated_at', params).fetchone()
+            else:
+                conn.execute(query, params)
+                row = None
+        
+        if row:
+            self.title = row['title']
+            self.content = row['content']
+            self.mood_rating = row['mood_rating'] if row['mood_rating'] is not None else 3
+            self.updated_at = datetime.fromisoformat(row['updated_at'])
+            return
         
         if title is not None:
-            updates.append("title = ?")
-            params.append(title)
             self.title = title
         
         if content is not None:
-            updates.append("content = ?")
-            params.append(content)
             self.content = content
         
         if mood_rating is not None:
-            updates.append("mood_rating = ?")
-            params.append(mood_rating)
             self.mood_rating = mood_rating
         
-        if updates:
-            updates.append("updated_at = ?")
-            params.append(datetime.now().isoformat())
-            self.updated_at = datetime.now()
-            
-            params.append(self.id)
-            
-            query = f"UPDATE journal_entries SET {', '.join(updates)} WHERE id = ?"
-            cursor.execute(query, params)
-            
-            conn.commit()
-        
-        conn.close()
+        self.updated_at = now
     
     def delete(self):
 
         if self.id:
-            conn = get_connection()
-            cursor = conn.cursor()
+            with get_connection() as conn:
+                cursor = conn.cursor()
             
-            cursor.execute('DELETE FROM journal_entries WHERE id = ?', (self.id,))
-            
-            conn.commit()
-            conn.close()
+                cursor.execute('DELETE FROM journal_entries WHERE id = ?', (self.id,))
     
     def get_formatted_date(self):
 
@@ -274,7 +363,8 @@ class JournalEntry:
     def get_content_preview(self, max_length=150):
 
         content = self.content
-        if self.is_encrypted and self.encrypted_content:
+        # List queries don't load encrypted_content, so the flag alone decides
+        if self.is_encrypted:
             content = "[Encrypted Entry]"
         
         return content[:max_length] + "..." if len(content) > max_length else content
@@ -284,49 +374,41 @@ class PomodoroSession:
     @staticmethod
     def create(duration, task_description=""):
 
-        conn = get_connection()
-        cursor = conn.cursor()
+        with get_connection() as conn:
+            cursor = conn.cursor()
         
-        cursor.execute('''
-            INSERT INTO pomodoro_sessions (duration, task_description)
-            VALUES (?, ?)
-        ''', (duration, task_description))
+            cursor.execute('''
+                INSERT INTO pomodoro_sessions (duration, task_description)
+                VALUES (?, ?)
+            ''', (duration, task_description))
         
-        session_id = cursor.lastrowid
-        conn.commit()
-        conn.close()
+            session_id = cursor.lastrowid
         
         return session_id
     
     @staticmethod
     def complete_session(session_id):
 
-        conn = get_connection()
-        cursor = conn.cursor()
-        
-        cursor.execute('''
-            UPDATE pomodoro_sessions 
-            SET completed = TRUE, ended_at = ?
-            WHERE id = ?
-        ''', (datetime.now().isoformat(), session_id))
-        
-        conn.commit()
-        conn.close()
+        with get_connection() as conn:
+            conn.execute('''
+                UPDATE pomodoro_sessions 
+                SET completed = TRUE, ended_at = ?
+                WHERE id = ?
+            ''', (datetime.now().isoformat(), session_id))
     
     @staticmethod
     def get_recent_sessions(limit=10):
 
-        conn = get_connection()
-        cursor = conn.cursor()
+        with get_connection() as conn:
+            cursor = conn.cursor()
         
-        cursor.execute('''
-            SELECT * FROM pomodoro_sessions 
-            ORDER BY started_at DESC 
-            LIMIT ?
-        ''', (limit,))
+            cursor.execute(f'''
+                SELECT {POMODORO_COLUMNS} FROM pomodoro_sessions 
+                ORDER BY started_at DESC 
+                LIMIT ?
+            ''', (limit,))
         
-        sessions = cursor.fetchall()
-        conn.close()
+            sessions = cursor.fetchall()
         
         return sessions
 
@@ -339,181 +421,238 @@ class CalendarEvent:
         self.description = description
         self.event_date = event_date or datetime.now().date()
         self.priority = priority  # 'important', 'next_important', 'normal'
-        self.created_at = created_at or datetime.now()
-        self.updated_at = updated_at or datetime.now()
+        if not (created_at and updated_at):
+            now = datetime.now()
+            created_at = created_at or now
+            updated_at = updated_at or now
+        self.created_at = created_at
+        self.updated_at = updated_at
+    
+    @property
+    def event_date(self):
+        # Rows carry the ISO date string; parse it only when a date is needed
+        if isinstance(self._event_date, str):
+            self._event_date = datetime.fromisoformat(self._event_date).date()
+        return self._event_date
+    
+    @event_date.setter
+    def event_date(self, value):
+        self._event_date = value
+    
+    # Timestamps get the same lazy parse, so callers always see datetimes
+    # whether the event came from a row or was built in memory
+    @property
+    def created_at(self):
+        if isinstance(self._created_at, str):
+            self._created_at = datetime.fromisoformat(self._created_at)
+        return self._created_at
+    
+    @created_at.setter
+    def created_at(self, value):
+        self._created_at = value
+    
+    @property
+    def updated_at(self):
+        if isinstance(self._updated_at, str):
+            self._updated_at = datetime.fromisoformat(self._updated_at)
+        return self._updated_at
+    
+    @updated_at.setter
+    def updated_at(self, value):
+        self._updated_at = value
+    
+    @classmethod
+    def _row_to_event(cls, row):
+        # Dates and timestamps are passed through as stored; the properties parse on access
+        created_at = row['created_at']
+        updated_at = row['updated_at']
+        
+        return cls(
+            id=row['id'],
+            title=row['title'],
+            description=row['description'] or "",
+            event_date=row['event_date'],
+            priority=row['priority'] or "normal",
+            created_at=created_at,
+            updated_at=updated_at
+        )
     
     @staticmethod
     def create(title, description="", event_date=None, priority="normal"):
-        conn = get_connection()
-        cursor = conn.cursor()
+        with get_connection() as conn:
+            cursor = conn.cursor()
         
+            cursor.execute('''
+                INSERT INTO calendar_events (title, description, event_date, priority)
+                VALUES (?, ?, ?, ?)
+            ''', (title, description, CalendarEvent._format_event_date(event_date), priority))
+        
+            event_id = cursor.lastrowid
+        
+        return event_id
+    
+    @staticmethod
+    def create_many(events):
+        # Each item is (title, description, event_date, priority); see Todo.create_many
+        rows = (
+            (title, description, CalendarEvent._format_event_date(event_date), priority)
+            for title, description, event_date, priority in events
+        )
+        
+        with get_transaction() as conn:
+            conn.executemany('''
+                INSERT INTO calendar_events (title, description, event_date, priority)
+                VALUES (?, ?, ?, ?)
+            ''', rows)
+    
+    @staticmethod
+    def _format_event_date(event_date):
         # Format date for database storage
-        if event_date:
+        if not event_date:
+            return datetime.now().date().isoformat()
+        if isinstance(event_date, datetime):
+            return event_date.date().isoformat()
+        return event_date.isoformat()
+    
+    @staticmethod
+    def get_all(limit=None):
+        return CalendarEvent.get_page(0, -1 if limit is None else limit)
+    
+    @staticmethod
+    def get_page(offset=0, limit=100):
+        with get_connection() as conn:
+            cursor = conn.cursor()
+        
+            cursor.execute(f'''
+                SELECT {CALENDAR_COLUMNS} FROM calendar_events
+                ORDER BY event_date ASC
+                LIMIT ? OFFSET ?
+            ''', (limit, offset))
+            rows = cursor.fetchall()
+        
+        row_to_event = CalendarEvent._row_to_event
+        return [row_to_event(row) for row in rows]
+    
+    @staticmethod
+    def iter_all():
+        # Same contract as JournalEntry.iter_all: exhaust or close() the iterator
+        with get_connection() as conn:
+            cursor = conn.execute(f'SELECT {CALENDAR_COLUMNS} FROM calendar_events ORDER BY event_date ASC')
+            try:
+                for row in cursor:
+                    yield CalendarEvent._row_to_event(row)
+            finally:
+                _release_cursor(conn, cursor)
+    
+    @staticmethod
+    def get_by_date(event_date, limit=None):
+        with get_connection() as conn:
+            cursor = conn.cursor()
+        
             if isinstance(event_date, datetime):
                 date_str = event_date.date().isoformat()
             else:
                 date_str = event_date.isoformat()
-        else:
-            date_str = datetime.now().date().isoformat()
         
-        cursor.execute('''
-            INSERT INTO calendar_events (title, description, event_date, priority)
-            VALUES (?, ?, ?, ?)
-        ''', (title, description, date_str, priority))
+            cursor.execute(f'''
+                SELECT {CALENDAR_COLUMNS} FROM calendar_events 
+                WHERE event_date = ?
+                ORDER BY created_at ASC
+                LIMIT ?
+            ''', (date_str, -1 if limit is None else limit))
         
-        event_id = cursor.lastrowid
-        conn.commit()
-        conn.close()
+            rows = cursor.fetchall()
         
-        return event_id
+        row_to_event = CalendarEvent._row_to_event
+        return [row_to_event(row) for row in rows]
     
     @staticmethod
-    def get_all():
-        conn = get_connection()
-        cursor = conn.cursor()
-        
-        cursor.execute('SELECT * FROM calendar_events ORDER BY event_date ASC')
-        rows = cursor.fetchall()
-        
-        conn.close()
-        
-        events = []
-        for row in rows:
-            event = CalendarEvent(
-                id=row[0],
-                title=row[1],
-                description=row[2] or "",
-                event_date=datetime.fromisoformat(row[3]).date(),
-                priority=row[4] or "normal",
-                created_at=datetime.fromisoformat(row[5]) if row[5] else datetime.now(),
-                updated_at=datetime.fromisoformat(row[6]) if row[6] else datetime.now()
-            )
-            events.append(event)
-        
-        return events
+    def get_for_month(year, month):
+        # Half-open [first of month, first of next month) range so the event_date index is used
+        start = date(year, month, 1).isoformat()
+        end = (date(year + 1, 1, 1) if month == 12 else date(year, month + 1, 1)).isoformat()
+        
+        with get_connection() as conn:
+            cursor = conn.execute(f'''
+                SELECT {CALENDAR_COLUMNS} FROM calendar_events
+                WHERE event_date >= ? AND event_date < ?
+                ORDER BY event_date ASC, created_at ASC
+            ''', (start, end))
+            rows = cursor.fetchall()
+        
+        row_to_event = CalendarEvent._row_to_event
+        return [row_to_event(row) for row in rows]
     
     @staticmethod
-    def get_by_date(event_date):
-        conn = get_connection()
-        cursor = conn.cursor()
+    def get_upcoming_events(limit=2):
+        with get_connection() as conn:
+            cursor = conn.cursor()
         
-        if isinstance(event_date, datetime):
-            date_str = event_date.date().isoformat()
-        else:
-            date_str = event_date.isoformat()
-        
-        cursor.execute('''
-            SELECT * FROM calendar_events 
-            WHERE event_date = ?
-            ORDER BY created_at ASC
-        ''', (date_str,))
-        
-        rows = cursor.fetchall()
-        conn.close()
-        
-        events = []
-        for row in rows:
-            event = CalendarEvent(
-                id=row[0],
-                title=row[1],
-                description=row[2] or "",
-                event_date=datetime.fromisoformat(row[3]).date(),
-                priority=row[4] or "normal",
-                created_at=datetime.fromisoformat(row[5]) if row[5] else datetime.now(),
-                updated_at=datetime.fromisoformat(row[6]) if row[6] else datetime.now()
-            )
-            events.append(event)
+            today = datetime.now().date().isoformat()
         
-        return events
-    
-    @staticmethod
-    def get_upcoming_events(limit=2):
-        conn = get_connection()
-        cursor = conn.cursor()
-        
-        today = datetime.now().date().isoformat()
-        
-        cursor.execute('''
-            SELECT * FROM calendar_events 
-            WHERE event_date >= ?
-            ORDER BY event_date ASC, created_at ASC
-            LIMIT ?
-        ''', (today, limit))
-        
-        rows = cursor.fetchall()
-        conn.close()
-        
-        events = []
-        for row in rows:
-            event = CalendarEvent(
-                id=row[0],
-                title=row[1],
-                description=row[2] or "",
-                event_date=datetime.fromisoformat(row[3]).date(),
-                priority=row[4] or "normal",
-                created_at=datetime.fromisoformat(row[5]) if row[5] else datetime.now(),
-                updated_at=datetime.fromisoformat(row[6]) if row[6] else datetime.now()
-            )
-            events.append(event)
+            cursor.execute(f'''
+                SELECT {CALENDAR_COLUMNS} FROM calendar_events 
+                WHERE event_date >= ?
+                ORDER BY event_date ASC, created_at ASC
+                LIMIT ?
+            ''', (today, limit))
+        
+            rows = cursor.fetchall()
         
-        return events
+        row_to_event = CalendarEvent._row_to_event
+        return [row_to_event(row) for row in rows]
     
     def update(self, title=None, description=None, priority=None):
         if not self.id:
             return
         
-        conn = get_connection()
-        cursor = conn.cursor()
+        if title is None and description is None and priority is None:
+            return
+        
+        now = datetime.now()
+        
+        query = '''
+            UPDATE calendar_events
+            SET title = COALESCE(?, title), description = COALESCE(?, description),
+                priority = COALESCE(?, priority), updated_at = ?
+            WHERE id = ?
+        '''
+        params = (title, description, priority, now.isoformat(), self.id)
         
-        updates = []
-        params = []
+        with get_connection() as conn:
+            if HAS_RETURNING:
+                row = conn.execute(query + 'RETURNING title, description, priority, updated_at', params).fetchone()
+            else:
+                conn.execute(query, params)
+                row = None
+        
+        if row:
+            self.title = row['title']
+            self.description = row['description'] or ""
+            self.priority = row['priority'] or "normal"
+            self.updated_at = datetime.fromisoformat(row['updated_at'])
+            return
         
         if title is not None:
-            updates.append("title = ?")
-            params.append(title)
             self.title = title
         
         if description is not None:
-            updates.append("description = ?")
-            params.append(description)
             self.description = description
         
         if priority is not None:
-            updates.append("priority = ?")
-            params.append(priority)
             self.priority = priority
         
-        if updates:
-            updates.append("updated_at = ?")
-            params.append(datetime.now().isoformat())
-            self.updated_at = datetime.now()
-            
-            params.append(self.id)
-            
-            query = f"UPDATE calendar_events SET {', '.join(updates)} WHERE id = ?"
-            cursor.execute(query, params)
-            
-            conn.commit()
-        
-        conn.close()
+        self.updated_at = now
     
     def delete(self):
         if self.id:
-            conn = get_connection()
-            cursor = conn.cursor()
-            
-            cursor.execute('DELETE FROM calendar_events WHERE id = ?', (self.id,))
+            with get_connection() as conn:
+                cursor = conn.cursor()
             
-            conn.commit()
-            conn.close()
+                cursor.execute('DELETE FROM calendar_events WHERE id = ?', (self.id,))
     
     def get_formatted_date(self):
-        if isinstance(self.event_date, str):
-            event_date = datetime.fromisoformat(self.event_date).date()
-        else:
-            event_date = self.event_date
-        
-        return event_date.strftime("%B %d, %Y")
+        return self.event_date.strftime("%B %d, %Y")
     
     def get_priority_color(self):
         priority_colors = {
@@ -552,12 +691,14 @@ class User:
     def update_profile(name, email):
         from database.db import set_setting, get_setting
         
+        now = datetime.now()
+        
         set_setting('user_name', name)
         set_setting('user_email', email)
-        set_setting('profile_last_updated', datetime.now().isoformat())
+        set_setting('profile_last_updated', now.isoformat())
         
         if not get_setting('member_since', ''):
-            set_setting('member_since', datetime.now().strftime('%Y-%m-%d'))
+            set_setting('member_since', now.strftime('%Y-%m-%d'))
     
     @staticmethod
     def get_name():
@@ -0,0 +1,70 @@
+import queue
+import sqlite3
+from contextlib import contextmanager
+
+class ConnectionPool:
+
+    def __init__(self, db_path, pool_size=5, timeout=30):
+        self.db_path = db_path
+        self.timeout = timeout
+        self._pool = queue.Queue(maxsize=pool_size)
+
+        for _ in range(pool_size):
+            self._pool.put(self._create_connection())
+
+    def _create_connection(self):
+        conn = sqlite3.connect(
+            self.db_path, check_same_thread=False, timeout=self.timeout, cached_statements=256
+        )
+        conn.row_factory = sqlite3.Row
+        # journal_mode=WAL is persisted in the database file by initialize_database();
+        # the remaining pragmas are per-connection and are applied once here.
+        conn.execute('PRAGMA synchronous=NORMAL')
+        conn.execute('PRAGMA temp_store=MEMORY')
+        conn.execute('PRAGMA cache_size=-65536')
+        conn.execute('PRAGMA mmap_size=268435456')
+        conn.execute(f'PRAGMA busy_timeout={int(self.timeout * 1000)}')
+        return conn
+
+    def get(self):
+        # A local-file connection can't drop, so borrowing skips any health check;
+        # connection() replaces one only after it has failed
+        return self._pool.get(timeout=self.timeout)
+
+    def put(self, conn):
+        self._pool.put(conn)
+
+    @contextmanager
+    def connection(self):
+        conn = self.get()
+        try:
+            yield conn
+            conn.commit()
+        except Exception:
+            try:
+                conn.rollback()
+            except sqlite3.Error:
+                try:
+                    conn.close()
+                except sqlite3.Error:
+                    pass
+                conn = self._create_connection()
+            raise
+        finally:
+            self.put(conn)
+
+    @contextmanager
+    def transaction(self):
+        # Takes the write lock up front so multi-statement workflows can't hit
+        # SQLITE_BUSY halfway through when upgrading from a read transaction
+        with self.connection() as conn:
+            conn.execute('BEGIN IMMEDIATE')
+            yield conn
+
+    def close_all(self):
+        while True:
+            try:
+                conn = self._pool.get_nowait()
+            except queue.Empty:
+                break
+            conn.close()
@@ -90,8 +90,7 @@ class TodoManager:
     def clear_completed(self) -> int:
         completed = [t for t in self.todos if t["completed"]]
 
-        for todo in completed:
-            Todo.delete(todo["id"])
+        Todo.delete_many(todo["id"] for todo in completed)
 
         self.todos = [t for t in self.todos if not t["completed"]]
         self._update_stats()
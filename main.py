@@ -4,38 +4,37 @@ from PySide6.QtWidgets import QApplication, QStyleFactory
 from PySide6.QtCore import QDir, Qt
 from PySide6.QtGui import QIcon
 
-sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
-
-from ui.main_window import MainWindow
 from database.db import initialize_database
 import config
 
+if getattr(sys, 'frozen', False):
+    BASE_PATH = sys._MEIPASS
+else:
+    BASE_PATH = os.path.dirname(__file__)
+
+# Preferred first; the PNG is a fallback for platforms without .ico support
+APP_ICON_PATHS = (
+    os.path.join(BASE_PATH, 'assets', 'icons', 'app_icon.ico'),
+    os.path.join(BASE_PATH, 'assets', 'icons', 'app_icon.png'),
+)
+
 def setup_application():
     app = QApplication(sys.argv)
     app.setApplicationName("Origami")
     app.setApplicationVersion("1.0.1")
     app.setOrganizationName("Personal Productivity")
     
-    if getattr(sys, 'frozen', False):
-        base_path = sys._MEIPASS
-    else:
-        base_path = os.path.dirname(__file__)
-    
-    icon_path = os.path.join(base_path, 'assets', 'icons', 'app_icon.ico')
-    if os.path.exists(icon_path):
-        icon = QIcon(icon_path)
-        app.setWindowIcon(icon)
-        app.setDesktopFileName("Origami")
-        app.setApplicationDisplayName("Origami")
-        app.setQuitOnLastWindowClosed(True)
-    else:
-        png_icon_path = os.path.join(base_path, 'assets', 'icons', 'app_icon.png')
-        if os.path.exists(png_icon_path):
-            icon = QIcon(png_icon_path)
-            app.setWindowIcon(icon)
+    for icon_path in APP_ICON_PATHS:
+        if os.path.exists(icon_path):
+            # Set once on the application; MainWindow reuses this instance
+            app.setWindowIcon(QIcon(icon_path))
             app.setDesktopFileName("Origami")
             app.setApplicationDisplayName("Origami")
+            app.setQuitOnLastWindowClosed(True)
+            break
 
+    # Synchronous so a schema or I/O failure stops startup here rather than
+    # surfacing later as "no such table" errors from the UI
     initialize_database()
 
     app.setStyle(QStyleFactory.create('Fusion'))
@@ -46,10 +45,13 @@ def main():
     
     app = setup_application()
 
+    from ui.main_window import MainWindow
+
     main_window = MainWindow()
     main_window.show()
 
     sys.exit(app.exec())
 
 if __name__ == "__main__":
+    sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
     main()
\ No newline at end of file
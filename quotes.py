@@ -1,93 +1,95 @@
-MOTIVATIONAL_QUOTES = [
-    {
-        "text": "The only way to do great work is to love what you do.",
-        "author": "Steve Jobs"
-    },
-    {
-        "text": "Don't watch the clock; do what it does. Keep going.",
-        "author": "Sam Levenson"
-    },
-    {
-        "text": "Believe you can and you're halfway there.",
-        "author": "Theodore Roosevelt"
-    },
-    {
-        "text": "Everything you've ever wanted is on the other side of fear.",
-        "author": "George Addair"
-    },
-    {
-        "text": "It always seems impossible until it's done.",
-        "author": "Nelson Mandela"
-    },
-    {
-        "text": "Your time is limited, so don't waste it living someone else's life.",
-        "author": "Steve Jobs"
-    },
-    {
-        "text": "I can't change the direction of the wind, but I can adjust my sails to always reach my destination.",
-        "author": "Jimmy Dean"
-    },
-    {
-        "text": "The best way to predict the future is to create it.",
-        "author": "Abraham Lincoln"
-    },
-    {
-        "text": "Success is not final, failure is not fatal: it is the courage to continue that counts.",
-        "author": "Winston Churchill"
-    },
-    {
-        "text": "The future belongs to those who believe in the beauty of their dreams.",
-        "author": "Eleanor Roosevelt"
-    },
-    {
-        "text": "It does not matter how slowly you go as long as you do not stop.",
-        "author": "Confucius"
-    },
-    {
-        "text": "Everything you can imagine is real.",
-        "author": "Pablo Picasso"
-    },
-    {
-        "text": "Do what you can, with what you have, where you are.",
-        "author": "Theodore Roosevelt"
-    },
-    {
-        "text": "Act as if what you do makes a difference. It does.",
-        "author": "William James"
-    },
-    {
-        "text": "Success usually comes to those who are too busy to be looking for it.",
-        "author": "Henry David Thoreau"
-    },
-    {
-        "text": "Don't be afraid to give up the good to go for the great.",
-        "author": "John D. Rockefeller"
-    },
-    {
-        "text": "I find that the harder I work, the more luck I seem to have.",
-        "author": "Thomas Jefferson"
-    },
-    {
-        "text": "The way to get started is to quit talking and begin doing.",
-        "author": "Walt Disney"
-    },
-    {
-        "text": "The pessimist sees difficulty in every opportunity. The optimist sees opportunity in every difficulty.",
-        "author": "Winston Churchill"
-    },
-    {
-        "text": "Don't let yesterday take up too much of today.",
-        "author": "Will Rogers"
-    }
-]
+import sys
+from functools import lru_cache
+from random import Random
+from typing import NamedTuple
+
+class Quote(NamedTuple):
+    text: str
+    author: str
+
+# Stored as parallel tuples rather than a list of small dicts
+_TEXTS, _AUTHORS = zip(
+    ("The only way to do great work is to love what you do.",
+     "Steve Jobs"),
+    ("Don't watch the clock; do what it does. Keep going.",
+     "Sam Levenson"),
+    ("Believe you can and you're halfway there.",
+     "Theodore Roosevelt"),
+    ("Everything you've ever wanted is on the other side of fear.",
+     "George Addair"),
+    ("It always seems impossible until it's done.",
+     "Nelson Mandela"),
+    ("Your time is limited, so don't waste it living someone else's life.",
+     "Steve Jobs"),
+    ("I can't change the direction of the wind, but I can adjust my sails to always reach my destination.",
+     "Jimmy Dean"),
+    ("The best way to predict the future is to create it.",
+     "Abraham Lincoln"),
+    ("Success is not final, failure is not fatal: it is the courage to continue that counts.",
+     "Winston Churchill"),
+    ("The future belongs to those who believe in the beauty of their dreams.",
+     "Eleanor Roosevelt"),
+    ("It does not matter how slowly you go as long as you do not stop.",
+     "Confucius"),
+    ("Everything you can imagine is real.",
+     "Pablo Picasso"),
+    ("Do what you can, with what you have, where you are.",
+     "Theodore Roosevelt"),
+    ("Act as if what you do makes a difference. It does.",
+     "William James"),
+    ("Success usually comes to those who are too busy to be looking for it.",
+     "Henry David Thoreau"),
+    ("Don't be afraid to give up the good to go for the great.",
+     "John D. Rockefeller"),
+    ("I find that the harder I work, the more luck I seem to have.",
+     "Thomas Jefferson"),
+    ("The way to get started is to quit talking and begin doing.",
+     "Walt Disney"),
+    ("The pessimist sees difficulty in every opportunity. The optimist sees opportunity in every difficulty.",
+     "Winston Churchill"),
+    ("Don't let yesterday take up too much of today.",
+     "Will Rogers"),
+)
+
+# Repeated authors (and any future duplicates) share a single str object
+_TEXTS = tuple(map(sys.intern, _TEXTS))
+_AUTHORS = tuple(map(sys.intern, _AUTHORS))
+
+# Text/author separators keyed by style; add an entry plus a one-line getter for new formats
+_QUOTE_STYLES = {
+    "default": " — ",
+}
+
+@lru_cache(maxsize=16)
+def _format_all(style):
+    # Each style is formatted at most once per process
+    sep = _QUOTE_STYLES[style]
+    return tuple(sys.intern(sep.join(pair)) for pair in zip(_TEXTS, _AUTHORS))
+
+_N_QUOTES = len(_TEXTS)
+
+# Dedicated generator so quote picks don't share the global random state
+_RNG = Random()
+
+# Immutable records, safe to hand out without defensive copies
+_QUOTES_FROZEN = tuple(Quote(t, a) for t, a in zip(_TEXTS, _AUTHORS))
 
 def get_random_quote():
-    import random
-    quote = random.choice(MOTIVATIONAL_QUOTES)
-    return f"{quote['text']} — {quote['author']}"
+    return _format_all("default")[_RNG.randrange(_N_QUOTES)]
+
+def get_random_quotes_batch(k):
+    # Samples k quotes (with replacement) in a single call
+    return _RNG.choices(_format_all("default"), k=k)
 
 def get_all_quotes():
-    return MOTIVATIONAL_QUOTES
+    return _QUOTES_FROZEN
 
 def get_formatted_quotes():
-    return [f"{q['text']} — {q['author']}" for q in MOTIVATIONAL_QUOTES]
\ No newline at end of file
+    # Shared immutable tuple; use get_formatted_quotes_mutable() for a list
+    return _format_all("default")
+
+def get_formatted_quotes_mutable():
+    return list(_format_all("default"))
+
+def iter_formatted_quotes():
+    return iter(_format_all("default"))
@@ -1,140 +1,110 @@
-from functools import partial
+import weakref
+from collections import defaultdict
+from functools import lru_cache, partial
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QLabel,
-    QFrame, QDialog, QTextEdit, QButtonGroup, QRadioButton,
+    QFrame, QDialog, QPlainTextEdit, QButtonGroup, QRadioButton,
     QMessageBox, QScrollArea, QGridLayout, QSizePolicy, QSpacerItem, QComboBox
 )
-from PySide6.QtCore import Qt, QDate, QTimer, Signal, QPropertyAnimation, QEasingCurve
+from PySide6.QtCore import Qt, QDate, QSignalBlocker, QTimer, QThreadPool, Signal, QPropertyAnimation, QEasingCurve
 from PySide6.QtGui import QFont, QColor, QCursor, QPalette
 from datetime import datetime, date, timedelta
 from database.models import CalendarEvent
 from database.db import get_setting
-from ui.common_widgets import CustomCard
-
-_CALENDAR_DARK = """
-    ModernCalendarWidget { background-color: #121212; color: #e0e0e0; }
-    QWidget { background-color: #121212; color: #e0e0e0; }
-    QPushButton#navButton {
-        background-color: #2d2d2d; color: #ffffff;
-        border: 2px solid #404040; border-radius: 20px;
+from ui.common_widgets import CustomCard, MarqueeLabel
+
+# Shared by both themes; only the palette differs
+_CALENDAR_TEMPLATE = """
+    ModernCalendarWidget {{ background-color: {bg}; color: {text}; }}
+    QWidget {{ background-color: {bg}; color: {text}; }}
+    QPushButton#navButton {{
+        background-color: {nav_bg}; color: {nav_text};
+        border: 2px solid {nav_border}; border-radius: 20px;
         font-size: 16px; font-weight: bold;
-    }
-    QPushButton#navButton:hover { background-color: #404040; border-color: #42a5f5; }
-    QPushButton#navButton:pressed { background-color: #1a1a1a; }
-    QLabel#monthYearLabel { color: #ffffff; }
-    QLabel#dayHeader {
-        color: #a0a0a0; padding: 10px; background-color: #2d2d2d;
+    }}
+    QPushButton#navButton:hover {{ background-color: {nav_hover_bg}; border-color: {accent}; color: {nav_hover_text}; }}
+    QPushButton#navButton:pressed {{ background-color: {nav_pressed_bg}; }}
+    QLabel#monthYearLabel {{ color: {title_text}; }}
+    QLabel#dayHeader {{
+        color: {header_text}; padding: 10px; background-color: {header_bg};
         border-radius: 5px; margin: 2px;
-    }
-    QPushButton#dateButton {
-        background-color: #1e1e1e; color: #e0e0e0;
-        border: 1px solid #303030; border-radius: 8px;
+    }}
+    QPushButton[cellState="default"] {{
+        background-color: {cell_bg}; color: {text};
+        border: 1px solid {cell_border}; border-radius: 8px;
         padding: 8px; min-height: 40px; font-size: 14px; font-weight: 500;
-    }
-    QPushButton#dateButton:hover { background-color: #2d2d2d; border-color: #42a5f5; }
-    QPushButton#dateButtonToday {
-        background-color: #42a5f5; color: #ffffff;
-        border: 1px solid #1976d2; border-radius: 8px;
+    }}
+    QPushButton[cellState="default"]:hover {{ background-color: {cell_hover_bg}; border-color: {accent}; }}
+    QPushButton[cellState="today"] {{
+        background-color: {accent}; color: #ffffff;
+        border: 1px solid {accent_dark}; border-radius: 8px;
         padding: 8px; min-height: 40px; font-size: 14px; font-weight: bold;
-    }
-    QPushButton#dateButtonTodayWithEvent {
+    }}
+    QPushButton[cellState="todayWithEvent"] {{
         background-color: #8e24aa; color: #ffffff;
         border: 3px solid #6a1b9a; border-radius: 8px;
         padding: 8px; min-height: 40px; font-size: 14px; font-weight: bold;
-    }
-    QPushButton#dateButtonTodayWithEvent:hover { background-color: #ab47bc; }
-    QPushButton#dateButtonRed {
+    }}
+    QPushButton[cellState="todayWithEvent"]:hover {{ background-color: #ab47bc; }}
+    QPushButton[cellState="important"] {{
         background-color: #ff4444; color: #ffffff;
-        border: 1px solid #303030; border-radius: 8px;
+        border: 1px solid {cell_border}; border-radius: 8px;
         padding: 8px; min-height: 40px; font-size: 14px; font-weight: bold;
-    }
-    QPushButton#dateButtonRed:hover { background-color: #ff6666; border-color: #42a5f5; }
-    QPushButton#dateButtonYellow {
+    }}
+    QPushButton[cellState="important"]:hover {{ background-color: #ff6666; border-color: {accent}; }}
+    QPushButton[cellState="nextImportant"] {{
         background-color: #ffaa00; color: #ffffff;
-        border: 1px solid #303030; border-radius: 8px;
+        border: 1px solid {cell_border}; border-radius: 8px;
         padding: 8px; min-height: 40px; font-size: 14px; font-weight: bold;
-    }
-    QPushButton#dateButtonYellow:hover { background-color: #ffbb22; border-color: #42a5f5; }
-    QPushButton#dateButtonGreen {
+    }}
+    QPushButton[cellState="nextImportant"]:hover {{ background-color: #ffbb22; border-color: {accent}; }}
+    QPushButton[cellState="normal"] {{
         background-color: #44aa44; color: #ffffff;
-        border: 1px solid #303030; border-radius: 8px;
+        border: 1px solid {cell_border}; border-radius: 8px;
         padding: 8px; min-height: 40px; font-size: 14px; font-weight: bold;
-    }
-    QPushButton#dateButtonGreen:hover { background-color: #66bb66; border-color: #42a5f5; }
-    QPushButton#dateButtonEmpty {
-        background-color: #1e1e1e; color: transparent;
-        border: 1px solid #303030; border-radius: 8px;
+    }}
+    QPushButton[cellState="normal"]:hover {{ background-color: #66bb66; border-color: {accent}; }}
+    QPushButton[cellState="empty"] {{
+        background-color: {cell_bg}; color: transparent;
+        border: 1px solid {cell_border}; border-radius: 8px;
         padding: 8px; min-height: 40px;
-    }
+    }}
 """
 
-_CALENDAR_LIGHT = """
-    ModernCalendarWidget { background-color: #f0f2f5; color: #212121; }
-    QWidget { background-color: #f0f2f5; color: #212121; }
-    QPushButton#navButton {
-        background-color: #ffffff; color: #333333;
-        border: 2px solid #e0e0e0; border-radius: 20px;
-        font-size: 16px; font-weight: bold;
-    }
-    QPushButton#navButton:hover { background-color: #f0f2f5; border-color: #1877f2; color: #1877f2; }
-    QPushButton#navButton:pressed { background-color: #e0e0e0; }
-    QLabel#monthYearLabel { color: #212121; }
-    QLabel#dayHeader {
-        color: #616161; padding: 10px; background-color: #f5f5f5;
-        border-radius: 5px; margin: 2px;
-    }
-    QPushButton#dateButton {
-        background-color: #ffffff; color: #212121;
-        border: 1px solid #e0e0e0; border-radius: 8px;
-        padding: 8px; min-height: 40px; font-size: 14px; font-weight: 500;
-    }
-    QPushButton#dateButton:hover { background-color: #f0f2f5; border-color: #1877f2; }
-    QPushButton#dateButtonToday {
-        background-color: #1877f2; color: #ffffff;
-        border: 1px solid #1565c0; border-radius: 8px;
-        padding: 8px; min-height: 40px; font-size: 14px; font-weight: bold;
-    }
-    QPushButton#dateButtonTodayWithEvent {
-        background-color: #8e24aa; color: #ffffff;
-        border: 3px solid #6a1b9a; border-radius: 8px;
-        padding: 8px; min-height: 40px; font-size: 14px; font-weight: bold;
-    }
-    QPushButton#dateButtonTodayWithEvent:hover { background-color: #ab47bc; }
-    QPushButton#dateButtonRed {
-        background-color: #ff4444; color: #ffffff;
-        border: 1px solid #e0e0e0; border-radius: 8px;
-        padding: 8px; min-height: 40px; font-size: 14px; font-weight: bold;
-    }
-    QPushButton#dateButtonRed:hover { background-color: #ff6666; border-color: #1877f2; }
-    QPushButton#dateButtonYellow {
-        background-color: #ffaa00; color: #ffffff;
-        border: 1px solid #e0e0e0; border-radius: 8px;
-        padding: 8px; min-height: 40px; font-size: 14px; font-weight: bold;
-    }
-    QPushButton#dateButtonYellow:hover { background-color: #ffbb22; border-color: #1877f2; }
-    QPushButton#dateButtonGreen {
-        background-color: #44aa44; color: #ffffff;
-        border: 1px solid #e0e0e0; border-radius: 8px;
-        padding: 8px; min-height: 40px; font-size: 14px; font-weight: bold;
-    }
-    QPushButton#dateButtonGreen:hover { background-color: #66bb66; border-color: #1877f2; }
-    QPushButton#dateButtonEmpty {
-        background-color: #ffffff; color: transparent;
-        border: 1px solid #e0e0e0; border-radius: 8px;
-        padding: 8px; min-height: 40px;
-    }
-"""
+_CALENDAR_PALETTES = {
+    'dark': {
+        'bg': '#121212', 'text': '#e0e0e0', 'title_text': '#ffffff',
+        'nav_bg': '#2d2d2d', 'nav_text': '#ffffff', 'nav_border': '#404040',
+        'nav_hover_bg': '#404040', 'nav_hover_text': '#ffffff', 'nav_pressed_bg': '#1a1a1a',
+        'header_text': '#a0a0a0', 'header_bg': '#2d2d2d',
+        'cell_bg': '#1e1e1e', 'cell_border': '#303030', 'cell_hover_bg': '#2d2d2d',
+        'accent': '#42a5f5', 'accent_dark': '#1976d2',
+    },
+    'light': {
+        'bg': '#f0f2f5', 'text': '#212121', 'title_text': '#212121',
+        'nav_bg': '#ffffff', 'nav_text': '#333333', 'nav_border': '#e0e0e0',
+        'nav_hover_bg': '#f0f2f5', 'nav_hover_text': '#1877f2', 'nav_pressed_bg': '#e0e0e0',
+        'header_text': '#616161', 'header_bg': '#f5f5f5',
+        'cell_bg': '#ffffff', 'cell_border': '#e0e0e0', 'cell_hover_bg': '#f0f2f5',
+        'accent': '#1877f2', 'accent_dark': '#1565c0',
+    },
+}
+
+
+@lru_cache(maxsize=None)
+def _calendar_qss(theme):
+    return _CALENDAR_TEMPLATE.format_map(_CALENDAR_PALETTES['dark' if theme == 'dark' else 'light'])
 
 _EVENT_MODAL_DARK = """
     QDialog { background-color: #1e1e1e; color: #e0e0e0; }
     QLabel { color: #e0e0e0; }
     QLabel#dateLabel { color: #42a5f5; font-weight: 600; }
-    QTextEdit {
+    QPlainTextEdit {
         background-color: #2d2d2d; color: #e0e0e0;
         border: 2px solid #404040; border-radius: 8px;
         padding: 10px; font-size: 14px;
     }
-    QTextEdit:focus { border-color: #42a5f5; }
+    QPlainTextEdit:focus { border-color: #42a5f5; }
     QRadioButton { color: #e0e0e0; spacing: 10px; }
     QRadioButton::indicator { width: 18px; height: 18px; }
     QRadioButton::indicator:unchecked {
@@ -167,12 +137,12 @@ _EVENT_MODAL_LIGHT = """
     QDialog { background-color: #ffffff; color: #212121; }
     QLabel { color: #212121; }
     QLabel#dateLabel { color: #1877f2; font-weight: 600; }
-    QTextEdit {
+    QPlainTextEdit {
         background-color: #ffffff; color: #212121;
         border: 2px solid #e0e0e0; border-radius: 8px;
         padding: 10px; font-size: 14px;
     }
-    QTextEdit:focus { border-color: #1877f2; }
+    QPlainTextEdit:focus { border-color: #1877f2; }
     QRadioButton { color: #212121; spacing: 10px; }
     QRadioButton::indicator { width: 18px; height: 18px; }
     QRadioButton::indicator:unchecked {
@@ -201,6 +171,41 @@ _EVENT_MODAL_LIGHT = """
     QPushButton#deleteButton:hover { background-color: #d32f2f; }
 """
 
+_EVENT_FRAME_DARK = """
+    QFrame#eventFrame {
+        background-color: #262626; border: 2px solid #505050;
+        border-radius: 12px; margin: 4px 0px;
+    }
+    QLabel#eventDate {
+        color: #64b5f6; font-weight: 700;
+        background-color: transparent; border: none;
+    }
+    QLabel#eventDescription, MarqueeLabel#eventDescription {
+        color: #e8e8e8; background-color: transparent; border: none;
+    }
+"""
+
+_EVENT_FRAME_LIGHT = """
+    QFrame#eventFrame {
+        background-color: #f8f9fa; border: 2px solid #c6cbd1;
+        border-radius: 12px; margin: 4px 0px;
+    }
+    QLabel#eventDate {
+        color: #1565c0; font-weight: 700;
+        background-color: transparent; border: none;
+    }
+    QLabel#eventDescription, MarqueeLabel#eventDescription {
+        color: #495057; background-color: transparent; border: none;
+    }
+"""
+
+# Theme-independent; matches the colours of CalendarEvent.get_priority_color()
+_PRIORITY_DOT_QSS = """
+    QFrame#priorityDot { background-color: #44aa44; border-radius: 6px; border: none; }
+    QFrame#priorityDot[priority="important"] { background-color: #ff4444; }
+    QFrame#priorityDot[priority="next_important"] { background-color: #ffaa00; }
+"""
+
 _CALENDAR_WIDGET_DARK = """
     QWidget { background-color: #121212; color: #e0e0e0; }
     QFrame { background-color: #121212; color: #e0e0e0; }
@@ -218,22 +223,22 @@ _CALENDAR_WIDGET_DARK = """
     QLabel#eventDescriptionLabel { color: #e0e0e0; font-weight: 600; background-color: transparent; border: none; }
     QLabel#priorityLabel { color: #e0e0e0; font-weight: 600; background-color: transparent; border: none; }
     QLabel { color: #e0e0e0; background-color: transparent; }
-    QTextEdit {
+    QPlainTextEdit {
         background-color: #2d2d2d; color: #e0e0e0;
         border: 2px solid #404040; border-radius: 8px;
         padding: 10px; font-size: 14px;
     }
-    QTextEdit:focus { border-color: #42a5f5; }
-    QPushButton#priorityButton {
+    QPlainTextEdit:focus { border-color: #42a5f5; }
+    QPushButton[role="priority"] {
         background-color: #2d2d2d; color: #e0e0e0;
         border: 2px solid #404040; border-radius: 8px;
         padding: 10px; font-size: 13px; font-weight: 600; min-height: 20px;
     }
-    QPushButton#priorityButton:hover { border-color: #42a5f5; background-color: #404040; }
-    QPushButton#priorityButton:checked {
+    QPushButton[role="priority"]:hover { border-color: #42a5f5; background-color: #404040; }
+    QPushButton[role="priority"]:checked {
         background-color: #42a5f5; border-color: #1976d2; color: #ffffff;
     }
-    QPushButton#priorityButton:pressed { background-color: #1976d2; }
+    QPushButton[role="priority"]:pressed { background-color: #1976d2; }
     QComboBox {
         background-color: #2d2d2d; color: #e0e0e0;
         border: 2px solid #404040; border-radius: 6px;
@@ -255,20 +260,20 @@ _CALENDAR_WIDGET_DARK = """
         selection-color: #ffffff; border-radius: 4px;
         padding: 6px; min-height: 25px;
     }
-    QPushButton#saveEventButton {
+    QPushButton[role="action"][variant="save"] {
         background-color: #42a5f5; color: #ffffff;
         border: none; border-radius: 8px;
-        padding: 15px 24px; font-weight: 600; font-size: 16px; min-height: 25px;
+        padding: 15px 24px; font-weight: 600; font-size: 13px; min-height: 25px;
     }
-    QPushButton#saveEventButton:hover { background-color: #1976d2; }
-    QPushButton#saveEventButton:pressed { background-color: #1565c0; }
-    QPushButton#deleteEventButton {
+    QPushButton[role="action"][variant="save"]:hover { background-color: #1976d2; }
+    QPushButton[role="action"][variant="save"]:pressed { background-color: #1565c0; }
+    QPushButton[role="action"][variant="delete"] {
         background-color: #f44336; color: #ffffff;
         border: none; border-radius: 8px;
-        padding: 15px 24px; font-weight: 600; font-size: 16px; min-height: 25px;
+        padding: 15px 24px; font-weight: 600; font-size: 13px; min-height: 25px;
     }
-    QPushButton#deleteEventButton:hover { background-color: #d32f2f; }
-    QPushButton#deleteEventButton:pressed { background-color: #b71c1c; }
+    QPushButton[role="action"][variant="delete"]:hover { background-color: #d32f2f; }
+    QPushButton[role="action"][variant="delete"]:pressed { background-color: #b71c1c; }
 """
 
 _CALENDAR_WIDGET_LIGHT = """
@@ -288,22 +293,22 @@ _CALENDAR_WIDGET_LIGHT = """
     QLabel#eventDescriptionLabel { color: #212121; font-weight: 600; background-color: transparent; border: none; }
     QLabel#priorityLabel { color: #212121; font-weight: 600; background-color: transparent; border: none; }
     QLabel { color: #212121; background-color: transparent; }
-    QTextEdit {
+    QPlainTextEdit {
         background-color: #ffffff; color: #212121;
         border: 2px solid #e0e0e0; border-radius: 8px;
         padding: 10px; font-size: 14px;
     }
-    QTextEdit:focus { border-color: #1877f2; }
-    QPushButton#priorityButton {
+    QPlainTextEdit:focus { border-color: #1877f2; }
+    QPushButton[role="priority"] {
         background-color: #ffffff; color: #212121;
         border: 2px solid #d0d0d0; border-radius: 8px;
         padding: 10px; font-size: 13px; font-weight: 600; min-height: 20px;
     }
-    QPushButton#priorityButton:hover { border-color: #1877f2; background-color: #f0f2f5; }
-    QPushButton#priorityButton:checked {
+    QPushButton[role="priority"]:hover { border-color: #1877f2; background-color: #f0f2f5; }
+    QPushButton[role="priority"]:checked {
         background-color: #1877f2; border-color: #1565c0; color: #ffffff;
     }
-    QPushButton#priorityButton:pressed { background-color: #1565c0; }
+    QPushButton[role="priority"]:pressed { background-color: #1565c0; }
     QComboBox {
         background-color: #ffffff; color: #212121;
         border: 2px solid #d0d0d0; border-radius: 6px;
@@ -325,34 +330,59 @@ _CALENDAR_WIDGET_LIGHT = """
         selection-color: #ffffff; border-radius: 4px;
         padding: 6px; min-height: 25px;
     }
-    QPushButton#saveEventButton {
+    QPushButton[role="action"][variant="save"] {
         background-color: #1877f2; color: #ffffff;
         border: none; border-radius: 8px;
-        padding: 15px 24px; font-weight: 600; font-size: 16px; min-height: 25px;
+        padding: 15px 24px; font-weight: 600; font-size: 13px; min-height: 25px;
     }
-    QPushButton#saveEventButton:hover { background-color: #1565c0; }
-    QPushButton#saveEventButton:pressed { background-color: #0d47a1; }
-    QPushButton#deleteEventButton {
+    QPushButton[role="action"][variant="save"]:hover { background-color: #1565c0; }
+    QPushButton[role="action"][variant="save"]:pressed { background-color: #0d47a1; }
+    QPushButton[role="action"][variant="delete"] {
         background-color: #f44336; color: #ffffff;
         border: none; border-radius: 8px;
-        padding: 15px 24px; font-weight: 600; font-size: 16px; min-height: 25px;
+        padding: 15px 24px; font-weight: 600; font-size: 13px; min-height: 25px;
     }
-    QPushButton#deleteEventButton:hover { background-color: #d32f2f; }
-    QPushButton#deleteEventButton:pressed { background-color: #b71c1c; }
+    QPushButton[role="action"][variant="delete"]:hover { background-color: #d32f2f; }
+    QPushButton[role="action"][variant="delete"]:pressed { background-color: #b71c1c; }
 """
 
-_MONTH_NAMES = [
+# Per-theme sheets for EventModal and CalendarWidget; unknown themes fall back to light
+_EVENT_MODAL_QSS = {'dark': _EVENT_MODAL_DARK, 'light': _EVENT_MODAL_LIGHT}
+_CALENDAR_WIDGET_QSS = {'dark': _CALENDAR_WIDGET_DARK, 'light': _CALENDAR_WIDGET_LIGHT}
+
+_MONTH_NAMES = (
     "January", "February", "March", "April", "May", "June",
-    "July", "August", "September", "October", "November", "December"
-]
+    "July", "August", "September", "October", "November", "December",
+)
+
+# events_ready token for background prefetches; real loads count up from 1
+_PREFETCH_TOKEN = 0
 
-_PRIORITY_OBJECT_NAMES = {
-    'important': 'dateButtonRed',
-    'next_important': 'dateButtonYellow',
-    'normal': 'dateButtonGreen',
+# Lower ranks win when a day has several events
+_PRIORITY_RANK = {'important': 0, 'next_important': 1, 'normal': 2}
+
+# Cell state by the day's top priority; None means the day has no events
+_PRIORITY_CELL_STATES = {
+    None: 'default',
+    'important': 'important',
+    'next_important': 'nextImportant',
+    'normal': 'normal',
 }
 
 
+@lru_cache(maxsize=None)
+def _arial(size, bold=False):
+    # Called lazily from widget construction, once a QGuiApplication exists.
+    # setFont() copies, so the shared instances are never mutated.
+    return QFont("Arial", size, QFont.Bold if bold else QFont.Normal)
+
+
+@lru_cache(maxsize=1)
+def _cached_theme():
+    # Cleared by every refresh_theme() below, which is how theme changes reach this module
+    return get_setting('theme', 'light')
+
+
 # ---------------------------------------------------------------------------
 # Widgets
 # ---------------------------------------------------------------------------
@@ -360,13 +390,24 @@ _PRIORITY_OBJECT_NAMES = {
 class ModernCalendarWidget(QWidget):
 
     date_clicked = Signal(QDate)
+    # (year, month, {date: [events]}, {date: priority}, request token), emitted from a pool thread
+    events_ready = Signal(int, int, object, object, int)
 
-    def __init__(self, parent=None):
+    def __init__(self, parent=None, owner=None):
         super().__init__(parent)
+        # The CalendarWidget that should track the active date; held weakly
+        self._owner = weakref.ref(owner) if owner is not None else None
         self.current_month = QDate.currentDate().month()
         self.current_year = QDate.currentDate().year()
         self.events = {}
-        self.date_buttons = {}
+        # Highest priority per day of the visible month; drives the cell colour
+        self._day_priority = {}
+        # (year, month) -> ({date: [events]}, {date: priority}); see load_events()/invalidate_events()
+        self._events_cache = {}
+        self._load_token = 0
+        self._applied_theme = None
+        self.date_cells = []
+        self.events_ready.connect(self._on_events_ready)
         self.setup_ui()
         self.load_events()
 
@@ -386,7 +427,7 @@ class ModernCalendarWidget(QWidget):
 
         self.month_year_label = QLabel()
         self.month_year_label.setAlignment(Qt.AlignCenter)
-        self.month_year_label.setFont(QFont("Arial", 24, QFont.Bold))
+        self.month_year_label.setFont(_arial(24, bold=True))
         self.month_year_label.setObjectName("monthYearLabel")
         header_layout.addWidget(self.month_year_label, 1)
 
@@ -404,24 +445,42 @@ class ModernCalendarWidget(QWidget):
         for i, day in enumerate(["Sun", "Mon", "Tue", "Wed", "Thu", "Fri", "Sat"]):
             lbl = QLabel(day)
             lbl.setAlignment(Qt.AlignCenter)
-            lbl.setFont(QFont("Arial", 12, QFont.Bold))
+            lbl.setFont(_arial(12, bold=True))
             lbl.setObjectName("dayHeader")
             self.calendar_grid.addWidget(lbl, 0, i)
 
+        # Fixed 5-row × 7-column grid (rows 1-5; row 0 is the header).
+        # The cells are created once and relabelled by update_calendar().
+        for index in range(35):
+            btn = QPushButton("")
+            # Styled through the cellState property; see _CALENDAR_TEMPLATE
+            btn.setObjectName("dateCell")
+            btn.date_info = None
+            btn.clicked.connect(self._on_cell_clicked)
+            self.calendar_grid.addWidget(btn, index // 7 + 1, index % 7)
+            self.date_cells.append(btn)
+
         layout.addLayout(self.calendar_grid)
 
         self.update_calendar()
         self.apply_theme()
 
     def apply_theme(self):
-        theme = get_setting('theme', 'light')
-        self.setStyleSheet(_CALENDAR_DARK if theme == 'dark' else _CALENDAR_LIGHT)
+        theme = _cached_theme()
+        if theme == self._applied_theme:
+            return
+        self.setStyleSheet(_calendar_qss(theme))
+        self._applied_theme = theme
 
     def update_calendar(self):
-        for button in self.date_buttons.values():
-            button.deleteLater()
-        self.date_buttons.clear()
-
+        # Relabel everything with updates off so the month change is a single repaint
+        self.setUpdatesEnabled(False)
+        try:
+            self._relabel_cells()
+        finally:
+            self.setUpdatesEnabled(True)
+
+    def _relabel_cells(self):
         self.month_year_label.setText(
             f"{_MONTH_NAMES[self.current_month - 1]} {self.current_year}"
         )
@@ -432,54 +491,54 @@ class ModernCalendarWidget(QWidget):
 
         # Convert to Sunday-based column index (0=Sun, 1=Mon, …)
         start_col = 0 if start_weekday == 7 else start_weekday
-        today = QDate.currentDate()
-
-        # Fixed 5-row × 7-column grid (rows 1-5; row 0 is the header)
-        for row in range(1, 6):
-            for col in range(7):
-                day_number = (row - 1) * 7 + col - start_col + 1
-
-                if 1 <= day_number <= days_in_month:
-                    button_date = QDate(self.current_year, self.current_month, day_number)
-                    date_key = button_date.toString("yyyy-MM-dd")
-                    has_events = bool(self.events.get(date_key))
-                    is_today = button_date == today
-
-                    btn = QPushButton(str(day_number))
-                    btn.setCursor(QCursor(Qt.PointingHandCursor))
-                    btn.date_info = button_date
-                    btn.clicked.connect(partial(self.emit_date_clicked, button_date))
-
-                    if has_events and is_today:
-                        btn.setObjectName("dateButtonTodayWithEvent")
-                    elif has_events:
-                        priority = self.events[date_key][0].priority
-                        btn.setObjectName(_PRIORITY_OBJECT_NAMES.get(priority, "dateButtonGreen"))
-                    elif is_today:
-                        btn.setObjectName("dateButtonToday")
-                    else:
-                        btn.setObjectName("dateButton")
-
-                    self.date_buttons[date_key] = btn
-                else:
-                    btn = QPushButton("")
-                    btn.setObjectName("dateButtonEmpty")
-                    btn.setEnabled(False)
 
-                self.calendar_grid.addWidget(btn, row, col)
+        # One date per day of the month, built before walking the cells.
+        # Events are keyed by datetime.date, so no strings are formatted here.
+        year, month = self.current_year, self.current_month
+        month_dates = [date(year, month, day) for day in range(1, days_in_month + 1)]
+        today = date.today()
+        day_priority = self._day_priority
+
+        for index, btn in enumerate(self.date_cells):
+            day_number = index - start_col + 1
+
+            if 1 <= day_number <= days_in_month:
+                button_date = month_dates[day_number - 1]
+                priority = day_priority.get(button_date)
 
-        self.style().unpolish(self)
-        self.style().polish(self)
+                btn.setText(str(day_number))
+                btn.setEnabled(True)
+                btn.setCursor(QCursor(Qt.PointingHandCursor))
+                btn.date_info = button_date
+
+                if button_date == today:
+                    state = "today" if priority is None else "todayWithEvent"
+                else:
+                    state = _PRIORITY_CELL_STATES.get(priority, "normal")
+            else:
+                btn.setText("")
+                btn.setEnabled(False)
+                btn.unsetCursor()
+                btn.date_info = None
+                state = "empty"
+
+            # Only cells whose state changed need their style recomputed
+            if btn.property("cellState") != state:
+                btn.setProperty("cellState", state)
+                btn.style().unpolish(btn)
+                btn.style().polish(btn)
+
+    def _on_cell_clicked(self):
+        day = self.sender().date_info
+        if day is not None:
+            self.emit_date_clicked(QDate(day.year, day.month, day.day))
 
     def emit_date_clicked(self, date):
         self.date_clicked.emit(date)
 
-        # Propagate the active date up to the CalendarWidget parent if present
-        parent = self.parent()
-        while parent and not isinstance(parent, CalendarWidget):
-            parent = parent.parent()
-        if parent:
-            parent._active_date = date
+        owner = self._owner() if self._owner is not None else None
+        if owner is not None:
+            owner._active_date = date
 
     def previous_month(self):
         if self.current_month == 1:
@@ -487,7 +546,6 @@ class ModernCalendarWidget(QWidget):
             self.current_year -= 1
         else:
             self.current_month -= 1
-        self.update_calendar()
         self.load_events()
 
     def next_month(self):
@@ -496,19 +554,72 @@ class ModernCalendarWidget(QWidget):
             self.current_year += 1
         else:
             self.current_month += 1
-        self.update_calendar()
         self.load_events()
 
     def load_events(self):
-        self.events.clear()
-        for event in CalendarEvent.get_all():
-            date_key = event.event_date.isoformat()
-            self.events.setdefault(date_key, []).append(event)
+        # Any fetch still in flight is now stale
+        self._load_token += 1
+        key = (self.current_year, self.current_month)
+        cached = self._events_cache.get(key)
+        if cached is not None:
+            self.events, self._day_priority = cached
+            self.update_calendar()
+            QTimer.singleShot(0, self._prefetch_adjacent)
+            return
+
+        # Draw the new month straight away; its cells fill in once the query returns.
+        # Keys are full dates, so events from another month never match these cells.
         self.update_calendar()
+        QThreadPool.globalInstance().start(partial(self._fetch_month, *key, self._load_token))
+
+    def _fetch_month(self, year, month, token):
+        # Runs on a pool thread; the connection pool hands it its own connection.
+        # Parsing event_date here keeps the ISO-string parse off the GUI thread.
+        events = defaultdict(list)
+        for event in CalendarEvent.get_for_month(year, month):
+            events[event.event_date].append(event)
+        day_priority = {
+            day: min(day_events, key=lambda e: _PRIORITY_RANK.get(e.priority, 2)).priority
+            for day, day_events in events.items()
+        }
+        self.events_ready.emit(year, month, events, day_priority, token)
+
+    def _on_events_ready(self, year, month, events, day_priority, token):
+        key = (year, month)
+        if token == _PREFETCH_TOKEN:
+            # Never replace what a real load (or a newer fetch) already stored
+            self._events_cache.setdefault(key, (events, day_priority))
+            return
+        if token != self._load_token:
+            return
+        self._events_cache[key] = (events, day_priority)
+        self.events = events
+        self._day_priority = day_priority
+        self.update_calendar()
+        QTimer.singleShot(0, self._prefetch_adjacent)
+
+    def _prefetch_adjacent(self):
+        # Warm the cache for the previous/next month so navigation doesn't wait on the DB
+        year, month = self.current_year, self.current_month
+        neighbours = (
+            (year - 1, 12) if month == 1 else (year, month - 1),
+            (year + 1, 1) if month == 12 else (year, month + 1),
+        )
+        pool = QThreadPool.globalInstance()
+        for key in neighbours:
+            if key not in self._events_cache:
+                pool.start(partial(self._fetch_month, *key, _PREFETCH_TOKEN), -1)
+
+    def invalidate_events(self, date):
+        # Drop the cached month containing ``date`` so the next load_events() re-queries it
+        self._events_cache.pop((date.year(), date.month()), None)
 
     def refresh_theme(self):
+        _cached_theme.cache_clear()
+        if _cached_theme() == self._applied_theme:
+            return
+        # No relabel: cellState doesn't depend on the theme, and the new sheet re-polishes the cells
         self.apply_theme()
-        self.update_calendar()
 
 
 class EventModal(QDialog):
@@ -521,11 +632,10 @@ class EventModal(QDialog):
         self.event_date = event_date
         self.event = event
         self.setWindowFlags(Qt.Dialog | Qt.WindowCloseButtonHint)
-        self.setAttribute(Qt.WA_DeleteOnClose)
+        # Not WA_DeleteOnClose: owners keep one instance and reset() it per date
+        self._applied_theme = None  # stylesheet is applied lazily in showEvent
         self.setup_ui()
-        self.apply_theme()
-        if event:
-            self.load_event_data()
+        self.reset(event_date, event)
 
     def setup_ui(self):
         self.setWindowTitle("Event Details")
@@ -536,19 +646,19 @@ class EventModal(QDialog):
         layout.setSpacing(20)
         layout.setContentsMargins(30, 30, 30, 30)
 
-        title_label = QLabel("Add Event" if not self.event else "Edit Event")
-        title_label.setFont(QFont("Arial", 18, QFont.Bold))
-        title_label.setAlignment(Qt.AlignCenter)
-        layout.addWidget(title_label)
+        self.title_label = QLabel()
+        self.title_label.setFont(_arial(18, bold=True))
+        self.title_label.setAlignment(Qt.AlignCenter)
+        layout.addWidget(self.title_label)
 
-        date_label = QLabel(f"Date: {self.event_date.toString('MMMM d, yyyy')}")
-        date_label.setFont(QFont("Arial", 12))
-        date_label.setObjectName("dateLabel")
-        layout.addWidget(date_label)
+        self.date_label = QLabel()
+        self.date_label.setFont(_arial(12))
+        self.date_label.setObjectName("dateLabel")
+        layout.addWidget(self.date_label)
 
         layout.addWidget(QLabel("Event Description:"))
 
-        self.description_input = QTextEdit()
+        self.description_input = QPlainTextEdit()
         self.description_input.setPlaceholderText("Enter event details...")
         self.description_input.setMinimumHeight(100)
         self.description_input.setMaximumHeight(150)
@@ -559,28 +669,34 @@ class EventModal(QDialog):
         self.priority_group = QButtonGroup(self)
 
         self.important_radio = QRadioButton("🔴 High")
-        self.important_radio.setFont(QFont("Arial", 11))
+        self.important_radio.setFont(_arial(11))
         self.priority_group.addButton(self.important_radio, 1)
         layout.addWidget(self.important_radio)
 
         self.next_important_radio = QRadioButton("🟡 Medium")
-        self.next_important_radio.setFont(QFont("Arial", 11))
+        self.next_important_radio.setFont(_arial(11))
         self.priority_group.addButton(self.next_important_radio, 2)
         layout.addWidget(self.next_important_radio)
 
         self.normal_radio = QRadioButton("🟢 Low")
-        self.normal_radio.setFont(QFont("Arial", 11))
+        self.normal_radio.setFont(_arial(11))
         self.normal_radio.setChecked(True)
         self.priority_group.addButton(self.normal_radio, 3)
         layout.addWidget(self.normal_radio)
 
         buttons_layout = QHBoxLayout()
 
-        if self.event:
-            self.delete_button = QPushButton("Delete")
-            self.delete_button.setObjectName("deleteButton")
-            self.delete_button.clicked.connect(self.delete_event)
-            buttons_layout.addWidget(self.delete_button)
+        # Always built so reset() can toggle it; only shown when editing an event
+        self.delete_button = QPushButton("Delete")
+        self.delete_button.setObjectName("deleteButton")
+        self.delete_button.clicked.connect(self.delete_event)
+        buttons_layout.addWidget(self.delete_button)
+
+        # Delete is confirmed by a second click within this window instead of a message box
+        self._delete_confirm_timer = QTimer(self)
+        self._delete_confirm_timer.setSingleShot(True)
+        self._delete_confirm_timer.setInterval(3000)
+        self._delete_confirm_timer.timeout.connect(self._reset_delete_button)
 
         buttons_layout.addStretch()
 
@@ -596,17 +712,40 @@ class EventModal(QDialog):
 
         layout.addLayout(buttons_layout)
 
+    def showEvent(self, event):
+        self.apply_theme()
+        super().showEvent(event)
+
     def apply_theme(self):
-        theme = get_setting('theme', 'light')
-        self.setStyleSheet(_EVENT_MODAL_DARK if theme == 'dark' else _EVENT_MODAL_LIGHT)
+        theme = _cached_theme()
+        if theme == self._applied_theme:
+            return
+        self.setStyleSheet(_EVENT_MODAL_QSS.get(theme, _EVENT_MODAL_LIGHT))
+        self._applied_theme = theme
 
     def refresh_theme(self):
-        self.apply_theme()
+        _cached_theme.cache_clear()
+        # A hidden dialog picks the new theme up in showEvent
+        if self.isVisible():
+            self.apply_theme()
+
+    def reset(self, event_date, event=None):
+        self.event_date = event_date
+        self.event = event
+        self.title_label.setText("Edit Event" if event else "Add Event")
+        self.date_label.setText(f"Date: {event_date.toString('MMMM d, yyyy')}")
+        self._reset_delete_button()
+        self.delete_button.setVisible(bool(event))
+        if event:
+            self.load_event_data()
+        else:
+            self.description_input.clear()
+            self.normal_radio.setChecked(True)
 
     def load_event_data(self):
         if not self.event:
             return
-        self.description_input.setText(self.event.description)
+        self.description_input.setPlainText(self.event.description)
         if self.event.priority == 'important':
             self.important_radio.setChecked(True)
         elif self.event.priority == 'next_important':
@@ -632,16 +771,17 @@ class EventModal(QDialog):
         if self.event:
             self.event.update(description=description, priority=priority)
         else:
+            title = description[:50]
             event_date_py = self.event_date.toPython()
             event_id = CalendarEvent.create(
-                title=description[:50],
+                title=title,
                 description=description,
                 event_date=event_date_py,
                 priority=priority,
             )
             self.event = CalendarEvent(
                 id=event_id,
-                title=description[:50],
+                title=title,
                 description=description,
                 event_date=event_date_py,
                 priority=priority,
@@ -653,27 +793,46 @@ class EventModal(QDialog):
     def delete_event(self):
         if not self.event:
             return
-        reply = QMessageBox.question(
-            self,
-            "Confirm Delete",
-            "Are you sure you want to delete this event?",
-            QMessageBox.Yes | QMessageBox.No,
-            QMessageBox.No,
-        )
-        if reply == QMessageBox.Yes:
-            self.event.delete()
-            self.event_deleted.emit(self.event)
-            self.accept()
+        if not self._delete_confirm_timer.isActive():
+            self.delete_button.setText("Click again to confirm")
+            self._delete_confirm_timer.start()
+            return
+
+        self._reset_delete_button()
+        self.event.delete()
+        self.event_deleted.emit(self.event)
+        self.accept()
+
+    def _reset_delete_button(self):
+        self._delete_confirm_timer.stop()
+        self.delete_button.setText("Delete")
 
 
 class UpcomingEventsCard(CustomCard):
 
+    MAX_EVENTS = 2
+
+    # (events, request token), emitted from a pool thread
+    events_loaded = Signal(object, int)
+
     def __init__(self, parent=None):
         super().__init__("Upcoming Events", parent)
+        self._load_token = 0
+        self.events_loaded.connect(self._apply_loaded_events)
+
+        # Theme refreshes, events_changed and the refresh timer often fire back to back;
+        # collapse them into one query and one rebuild
+        self._reload_coalesce_timer = QTimer(self)
+        self._reload_coalesce_timer.setSingleShot(True)
+        self._reload_coalesce_timer.setInterval(150)
+        self._reload_coalesce_timer.timeout.connect(self._do_load_events)
+
         self.setup_events_ui()
         self.load_events()
 
         self.refresh_timer = QTimer(self)
+        # Second-level accuracy is plenty for a 5 minute refresh and lets the OS batch wakeups
+        self.refresh_timer.setTimerType(Qt.VeryCoarseTimer)
         self.refresh_timer.timeout.connect(self.load_events)
         self.refresh_timer.start(300_000)  # 5 minutes
 
@@ -682,35 +841,89 @@ class UpcomingEventsCard(CustomCard):
         self.events_layout.setSpacing(8)
         self.content_layout.addLayout(self.events_layout)
 
+        self.no_events_label = QLabel("No upcoming events scheduled")
+        self.no_events_label.setStyleSheet(
+            "color: #888; font-style: italic; padding: 30px 20px; "
+            "font-size: 14px; text-align: center; "
+            "background-color: transparent; font-weight: 500;"
+        )
+        self.no_events_label.setAlignment(Qt.AlignCenter)
+        self.no_events_label.hide()
+        self.events_layout.addWidget(self.no_events_label)
+
+        # One reusable widget set per displayed event; reloads only relabel them
+        self._event_widget_pool = []
+        for _ in range(self.MAX_EVENTS):
+            slot = self.create_event_widget()
+            slot[0].hide()
+            self.events_layout.addWidget(slot[0])
+            self._event_widget_pool.append(slot)
+
     def refresh_events_immediately(self):
-        self.load_events()
+        # Skips the coalescing delay; a reload already waiting on the timer is superseded
+        self._reload_coalesce_timer.stop()
+        self._do_load_events()
+
+    def apply_card_style(self):
+        # Event frames are styled from the card's own sheet, so they need no per-widget
+        # stylesheet and pick up theme changes without being rebuilt
+        super().apply_card_style()
+        theme = _cached_theme()
+        frame_qss = _EVENT_FRAME_DARK if theme == 'dark' else _EVENT_FRAME_LIGHT
+        self.setStyleSheet(self.styleSheet() + frame_qss + _PRIORITY_DOT_QSS)
+        # Set here rather than in __init__: CustomCard.__init__ applies the first style
+        self._last_theme = theme
 
     def refresh_theme(self):
+        _cached_theme.cache_clear()
+        # refresh_theme is broadcast on every theme "apply"; only restyle on a real change
+        if _cached_theme() == self._last_theme:
+            return
         super().refresh_theme()
-        self.load_events()
 
     def load_events(self):
-        for i in reversed(range(self.events_layout.count())):
-            widget = self.events_layout.itemAt(i).widget()
-            if widget:
-                widget.deleteLater()
-
-        upcoming_events = CalendarEvent.get_upcoming_events(limit=2)
-
-        if not upcoming_events:
-            lbl = QLabel("No upcoming events scheduled")
-            lbl.setStyleSheet(
-                "color: #888; font-style: italic; padding: 30px 20px; "
-                "font-size: 14px; text-align: center; "
-                "background-color: transparent; font-weight: 500;"
-            )
-            lbl.setAlignment(Qt.AlignCenter)
-            self.events_layout.addWidget(lbl)
-        else:
-            for event in upcoming_events:
-                self.events_layout.addWidget(self.create_event_widget(event))
+        self._reload_coalesce_timer.start()
+
+    def _do_load_events(self):
+        # The query runs on the thread pool; the current widgets stay up until it returns
+        self._load_token += 1
+        QThreadPool.globalInstance().start(partial(self._fetch_upcoming, self._load_token))
+
+    def _fetch_upcoming(self, token):
+        self.events_loaded.emit(CalendarEvent.get_upcoming_events(limit=self.MAX_EVENTS), token)
 
-    def create_event_widget(self, event):
+    def _apply_loaded_events(self, upcoming_events, token):
+        if token != self._load_token:
+            return
+
+        # Show/hide and relabel the slots as one layout pass and one repaint
+        self.setUpdatesEnabled(False)
+        try:
+            self._show_events(upcoming_events)
+        finally:
+            self.setUpdatesEnabled(True)
+
+    def _show_events(self, upcoming_events):
+        self.no_events_label.setVisible(not upcoming_events)
+
+        for index, (event_frame, date_label, priority_dot, desc_label) in enumerate(self._event_widget_pool):
+            if index >= len(upcoming_events):
+                desc_label.stop_marquee()
+                event_frame.hide()
+                continue
+
+            event = upcoming_events[index]
+            date_label.setText(event.get_formatted_date())
+            desc_label.setText(event.description)
+            priority_dot.setToolTip(f"Priority: {event.get_priority_display()}")
+            if priority_dot.property("priority") != event.priority:
+                priority_dot.setProperty("priority", event.priority)
+                priority_dot.style().unpolish(priority_dot)
+                priority_dot.style().polish(priority_dot)
+            event_frame.show()
+
+    def create_event_widget(self):
+        # Returns (frame, date label, priority dot, description); filled in by _apply_loaded_events
         event_frame = QFrame()
         event_frame.setObjectName("eventFrame")
 
@@ -720,62 +933,25 @@ class UpcomingEventsCard(CustomCard):
 
         header_layout = QHBoxLayout()
 
-        date_label = QLabel(event.get_formatted_date())
-        date_label.setFont(QFont("Arial", 13, QFont.Bold))
+        date_label = QLabel()
+        date_label.setFont(_arial(13, bold=True))
         date_label.setObjectName("eventDate")
-        date_label.setStyleSheet("background-color: transparent; border: none;")
         header_layout.addWidget(date_label)
         header_layout.addStretch()
 
         priority_dot = QFrame()
+        priority_dot.setObjectName("priorityDot")
         priority_dot.setFixedSize(12, 12)
-        priority_dot.setStyleSheet(
-            f"background-color: {event.get_priority_color()}; "
-            "border-radius: 6px; border: none;"
-        )
-        priority_dot.setToolTip(f"Priority: {event.get_priority_display()}")
         header_layout.addWidget(priority_dot)
 
         layout.addLayout(header_layout)
 
-        from ui.common_widgets import MarqueeLabel
-        desc_label = MarqueeLabel(event.description)
+        desc_label = MarqueeLabel()
         desc_label.setObjectName("eventDescription")
-        desc_label.setFont(QFont("Arial", 12))
-        desc_label.setStyleSheet("background-color: transparent; border: none;")
+        desc_label.setFont(_arial(12))
         layout.addWidget(desc_label)
 
-        theme = get_setting('theme', 'light')
-        if theme == 'dark':
-            event_frame.setStyleSheet("""
-                QFrame#eventFrame {
-                    background-color: #262626; border: 2px solid #505050;
-                    border-radius: 12px; margin: 4px 0px;
-                }
-                QLabel#eventDate {
-                    color: #64b5f6; font-weight: 700;
-                    background-color: transparent; border: none;
-                }
-                QLabel#eventDescription, MarqueeLabel#eventDescription {
-                    color: #e8e8e8; background-color: transparent; border: none;
-                }
-            """)
-        else:
-            event_frame.setStyleSheet("""
-                QFrame#eventFrame {
-                    background-color: #f8f9fa; border: 2px solid #c6cbd1;
-                    border-radius: 12px; margin: 4px 0px;
-                }
-                QLabel#eventDate {
-                    color: #1565c0; font-weight: 700;
-                    background-color: transparent; border: none;
-                }
-                QLabel#eventDescription, MarqueeLabel#eventDescription {
-                    color: #495057; background-color: transparent; border: none;
-                }
-            """)
-
-        return event_frame
+        return event_frame, date_label, priority_dot, desc_label
 
 
 class CalendarWidget(QWidget):
@@ -785,6 +961,11 @@ class CalendarWidget(QWidget):
     def __init__(self, parent=None):
         super().__init__(parent)
         self.selected_date = QDate.currentDate()
+        # get_by_date result for selected_date; None until looked up or after a save/delete
+        self._current_events = None
+        self._applied_theme = None
+        # Set when a theme change arrives while hidden; showEvent applies it
+        self._theme_dirty = False
         self.setup_ui()
         self.apply_theme()
 
@@ -797,31 +978,45 @@ class CalendarWidget(QWidget):
         calendar_layout = QVBoxLayout(calendar_container)
         calendar_layout.setContentsMargins(10, 0, 10, 0)
 
-        self.calendar = ModernCalendarWidget()
+        self.calendar = ModernCalendarWidget(owner=self)
         self.calendar.date_clicked.connect(self.on_date_clicked)
         calendar_layout.addWidget(self.calendar)
         layout.addWidget(calendar_container)
 
         event_section_container = QWidget()
-        event_section_layout = QVBoxLayout(event_section_container)
-        event_section_layout.setContentsMargins(10, 0, 10, 0)
+        self._event_section_layout = QVBoxLayout(event_section_container)
+        self._event_section_layout.setContentsMargins(10, 0, 10, 0)
 
+        # The editor itself is built on first show or first date click; see _ensure_event_section
         self.setup_event_section()
-        event_section_layout.addWidget(self.create_event_section())
         layout.addWidget(event_section_container)
 
         layout.addStretch()
 
     def setup_event_section(self):
 
+        self._event_section_built = False
         self.event_description = None
         self.priority_dropdown = None
         self.selected_date_label = None
+        self.status_label = None
         self.desc_label = None
         self.priority_label = None
         self.save_button = None
         self.delete_button = None
 
+    def _ensure_event_section(self):
+        if self._event_section_built:
+            return
+        self._event_section_built = True
+        self._event_section_layout.addWidget(self.create_event_section())
+
+    def showEvent(self, event):
+        self._ensure_event_section()
+        if self._theme_dirty:
+            self.refresh_theme()
+        super().showEvent(event)
+
     def create_event_section(self):
         event_container = QWidget()
         event_layout = QVBoxLayout(event_container)
@@ -835,23 +1030,24 @@ class CalendarWidget(QWidget):
         frame_layout.setSpacing(15)
 
         title_label = QLabel("Add Event")
-        title_label.setFont(QFont("Arial", 16, QFont.Bold))
+        title_label.setFont(_arial(16, bold=True))
         title_label.setObjectName("eventSectionTitle")
         title_label.setAlignment(Qt.AlignCenter)
-        title_label.setStyleSheet("background-color: transparent; border: none;")
         frame_layout.addWidget(title_label)
 
         self.selected_date_label = QLabel(
             f"Selected Date: {self.selected_date.toString('MMMM d, yyyy')}"
         )
-        self.selected_date_label.setFont(QFont("Arial", 12, QFont.Bold))
+        self.selected_date_label.setFont(_arial(12, bold=True))
         self.selected_date_label.setObjectName("selectedDateLabel")
-        self.selected_date_label.setStyleSheet(
-            "color: #1877f2; background-color: transparent; border: none; font-weight: 600;"
-        )
         frame_layout.addWidget(self.selected_date_label)
 
-        self.event_description = QTextEdit()
+        # Save/delete feedback goes here so the date label text never has to change
+        self.status_label = QLabel("")
+        self.status_label.setObjectName("eventStatusLabel")
+        frame_layout.addWidget(self.status_label)
+
+        self.event_description = QPlainTextEdit()
         self.event_description.setPlaceholderText("Enter event details...")
         self.event_description.setMinimumHeight(120)
         self.event_description.setMaximumHeight(200)
@@ -863,16 +1059,15 @@ class CalendarWidget(QWidget):
         priority_row.setSpacing(15)
 
         self.priority_label = QLabel("Priority:")
-        self.priority_label.setFont(QFont("Arial", 10, QFont.Bold))
+        self.priority_label.setFont(_arial(10, bold=True))
         self.priority_label.setObjectName("priorityLabel")
-        self.priority_label.setStyleSheet("background-color: transparent; border: none;")
         self.priority_label.setFixedWidth(60)
         priority_row.addWidget(self.priority_label)
 
         self.priority_button_group = QButtonGroup(self)
 
         self.important_button = QPushButton("🔴 High")
-        self.important_button.setObjectName("priorityButton")
+        self.important_button.setProperty("role", "priority")
         self.important_button.setCheckable(True)
         self.important_button.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed)
         self.important_button.setMinimumHeight(40)
@@ -880,7 +1075,7 @@ class CalendarWidget(QWidget):
         priority_row.addWidget(self.important_button)
 
         self.next_important_button = QPushButton("🟡 Medium")
-        self.next_important_button.setObjectName("priorityButton")
+        self.next_important_button.setProperty("role", "priority")
         self.next_important_button.setCheckable(True)
         self.next_important_button.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed)
         self.next_important_button.setMinimumHeight(40)
@@ -888,7 +1083,7 @@ class CalendarWidget(QWidget):
         priority_row.addWidget(self.next_important_button)
 
         self.normal_button = QPushButton("🟢 Low")
-        self.normal_button.setObjectName("priorityButton")
+        self.normal_button.setProperty("role", "priority")
         self.normal_button.setCheckable(True)
         self.normal_button.setChecked(True)
         self.normal_button.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed)
@@ -905,6 +1100,8 @@ class CalendarWidget(QWidget):
 
         self.delete_button = QPushButton("Delete Event")
         self.delete_button.setObjectName("deleteEventButton")
+        self.delete_button.setProperty("role", "action")
+        self.delete_button.setProperty("variant", "delete")
         self.delete_button.setMinimumHeight(45)
         self.delete_button.setFixedWidth(200)
         self.delete_button.clicked.connect(self.delete_event)
@@ -913,6 +1110,8 @@ class CalendarWidget(QWidget):
 
         self.save_button = QPushButton("Save Event")
         self.save_button.setObjectName("saveEventButton")
+        self.save_button.setProperty("role", "action")
+        self.save_button.setProperty("variant", "save")
         self.save_button.setMinimumHeight(45)
         self.save_button.setFixedWidth(200)
         self.save_button.clicked.connect(self.save_event)
@@ -922,45 +1121,51 @@ class CalendarWidget(QWidget):
         frame_layout.addLayout(button_row)
 
         event_layout.addWidget(event_frame)
-        self.ensure_button_colors()
         return event_container
 
     def on_date_clicked(self, date):
+        self._ensure_event_section()
         self.selected_date = date
         self.selected_date_label.setText(
             f"Selected Date: {date.toString('MMMM d, yyyy')}"
         )
-        self.ensure_label_transparency()
+        self.status_label.clear()
 
-        existing_events = CalendarEvent.get_by_date(date.toPython())
+        # Only the first event of the day is edited here
+        existing_events = CalendarEvent.get_by_date(date.toPython(), limit=1)
+        self._current_events = existing_events
         if existing_events:
             event = existing_events[0]
-            self.event_description.setText(event.description)
-            if event.priority == 'important':
-                self.important_button.setChecked(True)
-            elif event.priority == 'next_important':
-                self.next_important_button.setChecked(True)
-            else:
-                self.normal_button.setChecked(True)
+            self.event_description.setPlainText(event.description)
+            self._check_priority(event.priority)
             self.delete_button.show()
         else:
             self.event_description.clear()
-            self.normal_button.setChecked(True)
+            self._check_priority('normal')
             self.delete_button.hide()
 
-        self.apply_theme()
+    def _check_priority(self, priority):
+        if priority == 'important':
+            button = self.important_button
+        elif priority == 'next_important':
+            button = self.next_important_button
+        else:
+            button = self.normal_button
+        # Re-checking the current button would only repolish it; skip the no-op
+        if button.isChecked():
+            return
+        with QSignalBlocker(self.priority_button_group):
+            button.setChecked(True)
 
     def save_event(self):
         description = self.event_description.toPlainText().strip()
         if not description:
-            self.selected_date_label.setText(
-                f"Selected Date: {self.selected_date.toString('MMMM d, yyyy')} "
-                "- Please enter description"
-            )
+            self.status_label.setText("Please enter description")
             return
 
         priority_data = self.get_selected_priority()
-        existing_events = CalendarEvent.get_by_date(self.selected_date.toPython())
+        date_py = self.selected_date.toPython()
+        existing_events = self._selected_events(date_py)
 
         if existing_events:
             existing_events[0].update(description=description, priority=priority_data)
@@ -969,38 +1174,44 @@ class CalendarWidget(QWidget):
             CalendarEvent.create(
                 title=description[:50],
                 description=description,
-                event_date=self.selected_date.toPython(),
+                event_date=date_py,
                 priority=priority_data,
             )
             status = "Event Saved!"
 
-        self.selected_date_label.setText(
-            f"Selected Date: {self.selected_date.toString('MMMM d, yyyy')} - {status}"
-        )
+        self.status_label.setText(status)
 
+        self._current_events = None
+        self.calendar.invalidate_events(self.selected_date)
         self.calendar.load_events()
         self.events_changed.emit()
 
         self.event_description.clear()
-        self.normal_button.setChecked(True)
+        self._check_priority('normal')
         self.delete_button.hide()
 
     def delete_event(self):
-        existing_events = CalendarEvent.get_by_date(self.selected_date.toPython())
+        existing_events = self._selected_events()
         if existing_events:
             existing_events[0].delete()
-            self.selected_date_label.setText(
-                f"Selected Date: {self.selected_date.toString('MMMM d, yyyy')} - Event Deleted!"
-            )
+            self._current_events = None
+            self.status_label.setText("Event Deleted!")
+            self.calendar.invalidate_events(self.selected_date)
             self.calendar.load_events()
             self.events_changed.emit()
             self.event_description.clear()
-            self.normal_button.setChecked(True)
+            self._check_priority('normal')
             self.delete_button.hide()
         else:
-            self.selected_date_label.setText(
-                f"Selected Date: {self.selected_date.toString('MMMM d, yyyy')} - No event to delete"
-            )
+            self.status_label.setText("No event to delete")
+
+    def _selected_events(self, date_py=None):
+        # Reuse the on_date_clicked lookup; re-query only after a save/delete cleared it
+        if self._current_events is None:
+            if date_py is None:
+                date_py = self.selected_date.toPython()
+            self._current_events = CalendarEvent.get_by_date(date_py, limit=1)
+        return self._current_events
 
     def get_selected_priority(self):
         if self.important_button.isChecked():
@@ -1015,61 +1226,29 @@ class CalendarWidget(QWidget):
     def on_event_deleted(self, event):
         pass
 
-    def apply_theme(self):
-        theme = get_setting('theme', 'light')
-        self.setStyleSheet(_CALENDAR_WIDGET_DARK if theme == 'dark' else _CALENDAR_WIDGET_LIGHT)
-        self.ensure_label_transparency()
-        self.ensure_button_colors()
-
-    def ensure_label_transparency(self):
-        theme = get_setting('theme', 'light')
-        blue = "#42a5f5" if theme == 'dark' else "#1877f2"
-
-        if self.selected_date_label:
-            self.selected_date_label.setStyleSheet(
-                f"color: {blue}; background-color: transparent; border: none; font-weight: 600;"
-            )
-
-        for attr in ('desc_label', 'priority_label'):
-            lbl = getattr(self, attr, None)
-            if lbl:
-                style = lbl.styleSheet()
-                if "background-color: transparent" not in style:
-                    lbl.setStyleSheet(style + "; background-color: transparent; border: none;")
-
-    def ensure_button_colors(self):
-        theme = get_setting('theme', 'light')
-        save_bg = "#42a5f5" if theme == 'dark' else "#1877f2"
-
-        if self.save_button:
-            self.save_button.setStyleSheet(
-                f"background-color: {save_bg}; color: #ffffff; border: none; "
-                "border-radius: 8px; font-weight: 600; font-size: 13px;"
-            )
-        if self.delete_button:
-            self.delete_button.setStyleSheet(
-                "background-color: #f44336; color: #ffffff; border: none; "
-                "border-radius: 8px; font-weight: 600; font-size: 13px;"
-            )
+    def apply_theme(self, theme=None):
+        if theme is None:
+            theme = _cached_theme()
+        # Re-parsing the sheet is the expensive part; skip it when nothing changed
+        if theme == self._applied_theme:
+            return
+        self.setStyleSheet(_CALENDAR_WIDGET_QSS.get(theme, _CALENDAR_WIDGET_LIGHT))
+        self._applied_theme = theme
 
     def refresh_theme(self):
-        self.apply_theme()
-        self.calendar.refresh_theme()
-        self.ensure_label_transparency()
-        self.ensure_button_colors()
-
-        for child in self.findChildren(CustomCard):
-            if hasattr(child, 'refresh_theme'):
-                child.refresh_theme()
-
-        from ui.common_widgets import ModernButton
-        for child in self.findChildren(ModernButton):
-            if hasattr(child, 'refresh_theme'):
-                child.refresh_theme()
-
-        for child in self.findChildren(UpcomingEventsCard):
-            if hasattr(child, 'refresh_theme'):
-                child.refresh_theme()
-
-        self.update()
-        self.calendar.update_calendar()
\ No newline at end of file
+        _cached_theme.cache_clear()
+        if not self.isVisible():
+            self._theme_dirty = True
+            return
+        self._theme_dirty = False
+        theme = _cached_theme()
+        # Theme signals also fire on a plain "Apply" with the same theme selected
+        if theme == self._applied_theme:
+            return
+        # Restyle the whole subtree with updates off; re-enabling them schedules one repaint
+        self.setUpdatesEnabled(False)
+        try:
+            self.apply_theme(theme)
+            self.calendar.refresh_theme()
+        finally:
+            self.setUpdatesEnabled(True)
\ No newline at end of file
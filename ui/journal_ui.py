@@ -570,19 +570,18 @@ class JournalWidget(QWidget):
 
     def load_entry_for_date(self, entry_date):
         try:
-            for entry in JournalEntry.get_all():
-                e_date = (entry.created_at.date() if isinstance(entry.created_at, datetime)
-                          else datetime.fromisoformat(entry.created_at).date())
-                if e_date == entry_date:
-                    content = entry.content
-                    if entry.is_encrypted and getattr(entry, 'encrypted_content', None):
-                        try:
-                            content = decrypt_journal_entry(entry.encrypted_content)
-                        except Exception as e:
-                            content = "[Encrypted content — unable to decrypt]"
-                            print(f"Error decrypting entry: {e}")
-                    self.entry_text_edit.setPlainText(content)
-                    return
+            entry = JournalEntry.get_by_date(entry_date)
+            if entry:
+                content = entry.content
+                encrypted_content = JournalEntry.get_encrypted_blob(entry.id) if entry.is_encrypted else None
+                if encrypted_content:
+                    try:
+                        content = decrypt_journal_entry(encrypted_content)
+                    except Exception as e:
+                        content = "[Encrypted content — unable to decrypt]"
+                        print(f"Error decrypting entry: {e}")
+                self.entry_text_edit.setPlainText(content)
+                return
             self.entry_text_edit.clear()
         except Exception as e:
             print(f"Error loading entry for date: {e}")
@@ -590,11 +589,7 @@ class JournalWidget(QWidget):
 
     def get_entry_for_date(self, entry_date):
         try:
-            for entry in JournalEntry.get_all():
-                e_date = (entry.created_at.date() if isinstance(entry.created_at, datetime)
-                          else datetime.fromisoformat(entry.created_at).date())
-                if e_date == entry_date:
-                    return entry
+            return JournalEntry.get_by_date(entry_date)
         except Exception as e:
             print(f"Error getting entry for date: {e}")
         return None
@@ -622,26 +617,22 @@ class JournalWidget(QWidget):
             print(f"Error saving journal entry: {e}")
 
     def _update_existing_entry(self, entry, content: str):
-        conn = get_connection()
-        cursor = conn.cursor()
-        cursor.execute(
-            "UPDATE journal_entries SET content = ?, updated_at = ? WHERE id = ?",
-            (content, datetime.now().isoformat(), entry.id),
-        )
-        conn.commit()
-        conn.close()
+        with get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(
+                "UPDATE journal_entries SET content = ?, updated_at = ? WHERE id = ?",
+                (content, datetime.now().isoformat(), entry.id),
+            )
 
     def _create_new_entry_record(self, content: str):
         title = f"Entry for {self.current_entry_date.strftime('%B %d, %Y')}"
         entry_datetime = datetime.combine(self.current_entry_date, datetime.min.time())
-        conn = get_connection()
-        cursor = conn.cursor()
-        cursor.execute(
-            "INSERT INTO journal_entries (title, content, created_at, updated_at) VALUES (?, ?, ?, ?)",
-            (title, content, entry_datetime.isoformat(), datetime.now().isoformat()),
-        )
-        conn.commit()
-        conn.close()
+        with get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(
+                "INSERT INTO journal_entries (title, content, created_at, updated_at) VALUES (?, ?, ?, ?)",
+                (title, content, entry_datetime.isoformat(), datetime.now().isoformat()),
+            )
 
     # ── Dashboard list ─────────────────────────────────────────────────────────
 
@@ -656,12 +647,10 @@ class JournalWidget(QWidget):
                 child.setParent(None)
 
         try:
-            entries = JournalEntry.get_all()
-
             if self.search_query:
-                entries = self.filter_entries_by_search(entries, self.search_query)
+                entries = self.filter_entries_by_search(JournalEntry.get_all(), self.search_query)
             else:
-                entries = entries[:10]
+                entries = JournalEntry.get_page(0, 10)
 
             if not entries:
                 label = QLabel("No journal entries found.")
@@ -759,6 +748,8 @@ class JournalWidget(QWidget):
 
         filtered = []
         query_lower = query.lower()
+        # One round trip for every blob the text match may need, instead of one per entry
+        blobs = JournalEntry.get_encrypted_blobs(entry.id for entry in entries if entry.is_encrypted)
 
         for entry in entries:
             e_date = (entry.created_at.date() if isinstance(entry.created_at, datetime)
@@ -769,9 +760,10 @@ class JournalWidget(QWidget):
                 continue
 
             content = entry.content
-            if entry.is_encrypted and getattr(entry, 'encrypted_content', None):
+            encrypted_content = blobs.get(entry.id)
+            if encrypted_content:
                 try:
-                    content = decrypt_journal_entry(entry.encrypted_content)
+                    content = decrypt_journal_entry(encrypted_content)
                 except Exception:
                     content = ""
 
@@ -1,7 +1,7 @@
 import sys
 import os
 from PySide6.QtWidgets import (
-    QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
+    QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
     QTabWidget, QMenuBar, QStatusBar, QMessageBox, QLabel,
     QPushButton, QListWidget, QListWidgetItem, QStackedWidget,
     QSplitter, QFrame, QGraphicsDropShadowEffect, QScrollArea
@@ -404,6 +404,12 @@ class MainWindow(QMainWindow):
         self.apply_theme()
     
     def set_window_icon(self):
+        # Reuse the icon already loaded by setup_application()
+        app_icon = QApplication.windowIcon()
+        if not app_icon.isNull():
+            self.setWindowIcon(app_icon)
+            return
+
         # Handle both development and PyInstaller executable paths
         if getattr(sys, 'frozen', False):
             # Running as PyInstaller executable